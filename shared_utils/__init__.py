@@ -3,6 +3,7 @@ Shared utilities for Bitcoin Treasury Analysis
 """
 
 from .bitcoin_analysis import (
+    CompanyArrays,
     load_strategy_tracker_stats,
     setup_plotting,
     run_company_analysis,
@@ -26,7 +27,8 @@ from .bitcoin_analysis import (
 from .google_sheets import (
     get_sheet_data,
     sheet_to_dataframe,
-    load_bitcoin_data_from_sheet
+    load_bitcoin_data_from_sheet,
+    load_bitcoin_data_from_sheets
 )
 from .s3_uploader import (
     upload_company_charts,
@@ -37,6 +39,7 @@ from .upload_handler import (
 )
 
 __all__ = [
+    'CompanyArrays',
     'load_strategy_tracker_stats',
     'setup_plotting',
     'run_company_analysis',
@@ -61,5 +64,6 @@ __all__ = [
     'upload_charts',
     'get_sheet_data',
     'sheet_to_dataframe',
-    'load_bitcoin_data_from_sheet'
+    'load_bitcoin_data_from_sheet',
+    'load_bitcoin_data_from_sheets'
 ]
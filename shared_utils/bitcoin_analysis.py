@@ -6,16 +6,85 @@ Provides reusable analysis functions for bitcoin treasury companies
 """
 
 # Import required libraries
+import glob
+import hashlib
 import json
 import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
+from typing import NamedTuple, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import requests
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
+
+from .http_cache import _json_loads, fetch_with_etag
+
+
+class CompanyArrays(NamedTuple):
+    """Numeric columns of a company DataFrame, extracted once as NumPy arrays
+    
+    Carried through the analysis pipeline so chart code can work on plain
+    arrays instead of re-indexing the DataFrame for every access.
+    """
+    dates: np.ndarray
+    btc_balance: np.ndarray
+    btc_per_diluted_share: np.ndarray
+    diluted_shares_outstanding: np.ndarray
+    stock_prices: np.ndarray
+    btc_prices: Optional[np.ndarray] = None
+    nav: Optional[np.ndarray] = None
+    fully_diluted_market_cap: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """Extract the analysis columns from a DataFrame (btc_prices and valuation columns are optional)"""
+        def optional_column(name):
+            return df[name].to_numpy() if name in df.columns else None
+
+        return cls(
+            dates=df['date'].to_numpy(),
+            btc_balance=df['btc_balance'].to_numpy(),
+            btc_per_diluted_share=df['btc_per_diluted_share'].to_numpy(),
+            diluted_shares_outstanding=df['diluted_shares_outstanding'].to_numpy(),
+            stock_prices=df['stock_prices'].to_numpy(),
+            btc_prices=optional_column('btc_prices'),
+            nav=optional_column('nav'),
+            fully_diluted_market_cap=optional_column('fully_diluted_market_cap')
+        )
+
+    def get_nav(self):
+        """Bitcoin NAV (btc_balance * btc_prices), precomputed by run_company_analysis when available"""
+        if self.nav is not None:
+            return self.nav
+        return self.btc_balance * self.btc_prices
+
+    def get_fully_diluted_market_cap(self):
+        """Fully diluted market cap (diluted_shares_outstanding * stock_prices)"""
+        if self.fully_diluted_market_cap is not None:
+            return self.fully_diluted_market_cap
+        return self.diluted_shares_outstanding * self.stock_prices
+
+    def to_dataframe(self):
+        """Rebuild a DataFrame with the standard column names"""
+        columns = {'date': self.dates}
+        for field in self._fields[1:]:
+            values = getattr(self, field)
+            if values is not None:
+                columns[field] = values
+        return pd.DataFrame(columns)
+
+
+class LinearFit(NamedTuple):
+    """Slope and intercept of a 1D least-squares fit, named like LinearRegression's attributes"""
+    coef_: np.ndarray
+    intercept_: float
+
+
+# Frames built by load_strategy_tracker_stats, keyed on (data_url, fallback path, fallback mtime)
+_tracker_stats_cache = {}
 
 
 def load_strategy_tracker_stats(fallback_file_path=None, prefix=None):
@@ -29,7 +98,9 @@ def load_strategy_tracker_stats(fallback_file_path=None, prefix=None):
                      If None, uses 'DATA_URL'
     
     Returns:
-        pd.DataFrame: Processed dataframe with bitcoin treasury data
+        pd.DataFrame: Processed dataframe with bitcoin treasury data. btc_balance, the prices
+            and btc_per_diluted_share are float32 (about 7 significant digits, plenty for
+            charting); share counts and market caps stay float64 so they remain exact
     """
     # Determine environment variable name
     if prefix:
@@ -40,12 +111,24 @@ def load_strategy_tracker_stats(fallback_file_path=None, prefix=None):
     # Check for prefixed DATA_URL environment variable
     data_url = os.getenv(env_var_name)
     
+    # Reuse the frame built earlier in this process for the same source; the fallback
+    # file's mtime is part of the key so edits to it are picked up
+    try:
+        fallback_mtime = os.path.getmtime(fallback_file_path) if fallback_file_path else None
+    except OSError:
+        fallback_mtime = None
+    cache_key = (data_url, fallback_file_path, fallback_mtime)
+    if cache_key in _tracker_stats_cache:
+        print(f"Using data already loaded for {env_var_name}")
+        # Callers add columns (e.g. run_company_analysis), so hand out a copy
+        return _tracker_stats_cache[cache_key].copy()
+    
     if data_url:
         print(f"Loading data from URL ({env_var_name}): {data_url}")
         try:
-            response = requests.get(data_url, timeout=30)
-            response.raise_for_status()  # Raise an exception for bad status codes
-            data = response.json()
+            # Conditional GET against the on-disk copy from the previous run
+            content = fetch_with_etag(data_url, cache_name=env_var_name.lower(), timeout=30)
+            data = _json_loads(content)
             print("Successfully loaded data from URL")
         except requests.exceptions.RequestException as e:
             print(f"Error fetching data from URL: {e}")
@@ -65,8 +148,8 @@ def load_strategy_tracker_stats(fallback_file_path=None, prefix=None):
         
         print(f"Loading data from local file: {fallback_file_path}")
         try:
-            with open(fallback_file_path, 'r') as f:
-                data = json.load(f)
+            with open(fallback_file_path, 'rb') as f:
+                data = _json_loads(f.read())
             print("Successfully loaded data from local file")
         except FileNotFoundError:
             raise FileNotFoundError(f"Could not find fallback data file: {fallback_file_path}")
@@ -75,32 +158,81 @@ def load_strategy_tracker_stats(fallback_file_path=None, prefix=None):
     
     # Process the data into DataFrame
     hist_data = data['historicalData']
-    df = pd.DataFrame({
-        'date': hist_data['dates'],
-        'btc_balance': hist_data['btc_balance'],
-        'stock_prices': hist_data['stock_prices'],
-        'btc_prices': hist_data['btc_prices'],
-        'diluted_shares_outstanding': hist_data['diluted_shares_outstanding'],
-        'market_cap_basic': hist_data['market_cap_basic']
-    })
-    
-    # Convert date column to datetime
-    df['date'] = pd.to_datetime(df['date'])
-    
-    # Calculate btc_per_diluted_share for analysis
-    df['btc_per_diluted_share'] = df['btc_balance'] / df['diluted_shares_outstanding']
-    
-    return df
+    # Convert each list to an ndarray once and hand it to pandas without a second copy;
+    # dtype=float64 turns JSON nulls into NaN just like the list constructor did
+    numeric_columns = ['btc_balance', 'stock_prices', 'btc_prices', 'diluted_shares_outstanding', 'market_cap_basic']
+    columns = {'date': np.asarray(hist_data['dates'])}
+    for column in numeric_columns:
+        columns[column] = np.asarray(hist_data[column], dtype=np.float64)
+    # Drop the parsed payload before building the frame so the Python lists and the
+    # frame are not held in memory at the same time
+    del data, hist_data
+    df = pd.DataFrame(columns, copy=False)
+    
+    # Convert date column to datetime; the tracker emits plain YYYY-MM-DD strings, so an
+    # explicit format keeps parsing on the vectorized path instead of per-row inference
+    df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d', cache=True)
+    
+    # Calculate btc_per_diluted_share for analysis (raw arrays, no index alignment needed)
+    df['btc_per_diluted_share'] = columns['btc_balance'] / columns['diluted_shares_outstanding']
+
+    # Downcast the charted columns to float32 - ample precision for charting and
+    # correlation work, at half the memory traffic for the log/filter/NAV passes.
+    # The ratio above is taken in float64 first; the regression upcasts again.
+    # Share counts and market caps run to ten digits and are reported as-is, so they
+    # keep float64 (float32 would turn 865,942,925 shares into 865,942,912)
+    for column in ['btc_balance', 'stock_prices', 'btc_prices', 'btc_per_diluted_share']:
+        df[column] = df[column].astype(np.float32)
+
+    _tracker_stats_cache[cache_key] = df
+    return df.copy()
+
+
+def _get_pyplot():
+    """Import pyplot on first use, so data-only callers never pay for matplotlib
+
+    Charts are only ever written to files; the non-GUI Agg backend is selected
+    unless the environment (e.g. a Jupyter kernel) has already chosen one via MPLBACKEND.
+    """
+    if 'matplotlib.pyplot' not in sys.modules and not os.getenv('MPLBACKEND'):
+        import matplotlib
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
 
 
 def setup_plotting():
     """Configure matplotlib plotting settings"""
+    plt = _get_pyplot()
     plt.style.use('default')
     plt.rcParams['figure.figsize'] = (12, 8)
     plt.rcParams['font.size'] = 12
+    # Pin the font and skip TeX so text lookups hit the font cache, and let Agg
+    # chunk very long time-series paths before rasterizing them
+    plt.rcParams.update({
+        'font.family': 'DejaVu Sans',
+        'text.usetex': False,
+        'agg.path.chunksize': 10000,
+    })
+
 
+def _apply_rc_params(rc_params):
+    """Process pool initializer: use the parent process' matplotlib settings"""
+    _get_pyplot().rcParams.update(rc_params)
 
-def run_company_analysis(df, company_name="Company", output_dir=None, chart_generators=None):
+
+def _analysis_cache_key(df, company_name, chart_generators, subtitle_date):
+    """Hash the input data, company, chart names and subtitle date (charts embed it)"""
+    hasher = hashlib.blake2b(digest_size=8)
+    # Leave out the valuation columns this function adds, so re-running on the same frame hits
+    input_df = df.drop(columns=['nav', 'fully_diluted_market_cap'], errors='ignore')
+    hasher.update(pd.util.hash_pandas_object(input_df, index=False).to_numpy().tobytes())
+    chart_names = sorted(chart_generators) if chart_generators is not None else ['default']
+    hasher.update(json.dumps([company_name, chart_names, subtitle_date]).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def run_company_analysis(df, company_name="Company", output_dir=None, chart_generators=None, use_cache=False):
     """Run complete analysis pipeline for a given company with customizable chart generation
     
     Args:
@@ -110,12 +242,45 @@ def run_company_analysis(df, company_name="Company", output_dir=None, chart_gene
         chart_generators: Dictionary of chart generation functions or None for default behavior.
             Format: {'chart_name': chart_function, ...}
             Each chart_function should accept (processed_data, company_name, output_dir)
+            and return the path of the chart it saved (used by use_cache)
+            processed_data['arrays'] holds the numeric columns as a CompanyArrays tuple
             If None, uses default chart generation (backward compatibility)
+        use_cache: Skip the run when output_dir already holds the charts from a run with the
+            same input data, chart names and date. Generator settings are not part of the key,
+            so leave this off while changing chart configuration. A run in which a chart
+            generator failed is not cached.
     """
     print(f"\n{'='*60}")
     print(f"RUNNING ANALYSIS FOR {company_name}")
     print(f"{'='*60}")
-    
+
+    # Loaders parse dates once; frames built by hand may still carry date strings
+    _ensure_datetime_dates(df)
+
+    # Every chart subtitle carries the run date; format it once for all of them
+    subtitle_date = time.strftime('%Y-%m-%d')
+
+    sentinel_path = None
+    if use_cache and output_dir:
+        cache_prefix = os.path.join(output_dir, f".cache_{company_name.lower()}_")
+        sentinel_path = cache_prefix + _analysis_cache_key(df, company_name, chart_generators, subtitle_date)
+        try:
+            with open(sentinel_path, 'r') as f:
+                cached_charts = json.load(f)
+            if cached_charts and all(os.path.exists(os.path.join(output_dir, name)) for name in cached_charts):
+                print(f"Input data unchanged, reusing {len(cached_charts)} existing charts")
+                return
+        except (OSError, ValueError):
+            pass
+
+    # Valuation columns shared by the NAV charts, computed once on raw arrays
+    if 'btc_prices' in df.columns:
+        df['nav'] = df['btc_balance'].to_numpy() * df['btc_prices'].to_numpy()
+    df['fully_diluted_market_cap'] = df['diluted_shares_outstanding'].to_numpy() * df['stock_prices'].to_numpy()
+
+    # Extract the numeric columns once; carried to chart generators below
+    arrays = CompanyArrays.from_dataframe(df)
+
     # Step 1: Filter and deduplicate
     valid_data, unique_data, duplicates = filter_and_deduplicate_data(df)
     
@@ -132,6 +297,7 @@ def run_company_analysis(df, company_name="Company", output_dir=None, chart_gene
     # Prepare processed data for chart generators
     processed_data = {
         'df': df,
+        'arrays': arrays,
         'valid_data': valid_data,
         'unique_data': unique_data,
         'duplicates': duplicates,
@@ -142,14 +308,19 @@ def run_company_analysis(df, company_name="Company", output_dir=None, chart_gene
         'y_pred_plot': y_pred_plot,
         'correlation': correlation,
         'slope': slope,
+        'intercept': intercept,
         'a_coeff': a_coeff,
-        'r2': r2
+        'r2': r2,
+        'subtitle_date': subtitle_date
     }
     
+    # Paths of the charts written by this run, and whether any generator failed
+    chart_paths = []
+    generator_failed = False
     if chart_generators is None:
         # Default behavior: generate all standard charts
         print("\nUsing default chart generation")
-        _generate_default_charts(processed_data, company_name, output_dir)
+        chart_paths = _generate_default_charts(processed_data, company_name, output_dir)
     else:
         # Custom chart generation
         chart_names = list(chart_generators.keys())
@@ -158,23 +329,40 @@ def run_company_analysis(df, company_name="Company", output_dir=None, chart_gene
         for chart_name, chart_function in chart_generators.items():
             try:
                 print(f"Generating {chart_name}...")
-                chart_function(processed_data, company_name, output_dir)
+                chart_path = chart_function(processed_data, company_name, output_dir)
+                if chart_path:
+                    chart_paths.append(chart_path)
             except Exception as e:
                 print(f"Error generating {chart_name}: {e}")
+                generator_failed = True
     
     # Step 6: Print analysis results
     print_detailed_summary(df, valid_data, unique_data, duplicates, correlation, slope, a_coeff, r2, company_name)
 
+    if sentinel_path:
+        # Older sentinels for the company are stale; a run with a failed chart is not recorded,
+        # so the next run regenerates everything instead of reusing an incomplete set
+        for stale_path in glob.glob(cache_prefix + '*'):
+            os.remove(stale_path)
+        if generator_failed:
+            print("Not caching this run because a chart failed to generate")
+        else:
+            with open(sentinel_path, 'w') as f:
+                json.dump(sorted(os.path.basename(path) for path in chart_paths), f)
+
 
 def _generate_default_charts(processed_data, company_name, output_dir):
-    """Generate all default charts using the standard chart functions with default configurations"""
+    """Generate all default charts using the standard chart functions with default configurations
+
+    Returns:
+        list: Paths of the saved charts
+    """
     # Extract data from processed_data dictionary
     df = processed_data['df']
     log_btc_balance = processed_data['log_btc_balance']
     log_btc_per_diluted_share = processed_data['log_btc_per_diluted_share']
     log_btc_balance_unique = processed_data['log_btc_balance_unique']
     log_btc_per_diluted_share_unique = processed_data['log_btc_per_diluted_share_unique']
-    y_pred_plot = processed_data['y_pred_plot']
     unique_data = processed_data['unique_data']
     correlation = processed_data['correlation']
     slope = processed_data['slope']
@@ -186,32 +374,110 @@ def _generate_default_charts(processed_data, company_name, output_dir):
         'nav_reference_levels': [3, 5, 7],
         'nav_reference_colors': ['#0000ff', '#008000', '#ff0000'],
         'projection_months': 2,
+        'subtitle_date': processed_data.get('subtitle_date'),
     }
     
-    # Generate all standard charts with default configuration
-    create_power_law_chart(df, company_name, {}, output_dir)  # Added empty config
-    
-    create_stock_nav_chart(df, company_name, default_config, output_dir)
-    
-    create_mnav_chart(df, company_name, default_config, output_dir)
-    
-    create_stacked_mc_btc_nav_chart(df, company_name, default_config, output_dir)
+    # The power law chart reuses the fit computed in run_company_analysis instead of redoing
+    # filter/log/regression. It only needs the logs and fit values, so hand it those as plain
+    # arrays; the frames in processed_data would otherwise be pickled to a worker process.
+    # Only the extent of log_btc_balance is drawn, so its min/max stand in for the full array.
+    power_law_fit = {
+        'log_btc_balance': np.array([log_btc_balance.min(), log_btc_balance.max()]),
+        'log_btc_balance_unique': log_btc_balance_unique.to_numpy(),
+        'log_btc_per_diluted_share_unique': log_btc_per_diluted_share_unique.to_numpy(),
+        'correlation': correlation,
+        'slope': slope,
+        'intercept': processed_data['intercept'],
+        'a_coeff': a_coeff,
+        'r2': r2,
+    }
     
-    create_btc_per_share_chart(df, company_name, default_config, output_dir)
+    # Generate all standard charts with default configuration
+    # (chart function, config, extra kwargs)
+    chart_calls = [
+        (create_power_law_chart, {'subtitle_date': default_config['subtitle_date']}, {'precomputed': power_law_fit}),
+        (create_stock_nav_chart, default_config, {}),
+        (create_mnav_chart, default_config, {}),
+        (create_stacked_mc_btc_nav_chart, default_config, {}),
+        (create_btc_per_share_chart, default_config, {}),
+    ]
+    
+    # The charts render independently, so spread them over worker processes when they
+    # are written to files and there is more than one core. Without output_dir the charts
+    # are shown (e.g. inline in a notebook), which only works in this process.
+    max_workers = min(len(chart_calls), os.cpu_count() or 1)
+    if output_dir is None or max_workers < 2:
+        chart_paths = [chart_function(df, company_name, config, output_dir, **kwargs)
+                       for chart_function, config, kwargs in chart_calls]
+        return [path for path in chart_paths if path]
+    
+    # Workers start from the caller's current style, including rcParams set after setup_plotting
+    rc_params = {key: value for key, value in _get_pyplot().rcParams.items() if key != 'backend'}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_apply_rc_params,
+                             initargs=(rc_params,)) as executor:
+        futures = [executor.submit(chart_function, df, company_name, config, output_dir, **kwargs)
+                   for chart_function, config, kwargs in chart_calls]
+        # result() re-raises a worker's exception, so a failed chart never reaches the cache
+        chart_paths = [future.result() for future in futures]
+    return [path for path in chart_paths if path]
+
+
+def _format_date_range(dates):
+    """Format the first/last of a datetime64 array as 'YYYY-MM-DD to YYYY-MM-DD'"""
+    start, end = np.datetime_as_string(np.array([dates.min(), dates.max()]), unit='D')
+    return f"{start} to {end}"
+
+
+def _save_chart(fig, filepath, config):
+    """Write a chart PNG; 'dpi' and 'png_compress_level' in config override the defaults"""
+    # zlib level 3 encodes flat chart backgrounds noticeably faster than Pillow's default 6
+    fig.savefig(filepath, dpi=config.get('dpi', 150),
+                pil_kwargs={'compress_level': config.get('png_compress_level', 3)})
+
+
+def _format_dollar_tick(value, tick_number):
+    """Y tick label for per-share prices, without scientific notation"""
+    if value >= 1:
+        return f'${value:.2f}'
+    else:
+        return f'${value:.4f}'
+
+
+def _format_millions_tick(value, tick_number):
+    """Y tick label for market values in millions/thousands, without scientific notation"""
+    if value >= 1e6:
+        return f'${value/1e6:.1f}M'
+    elif value >= 1e3:
+        return f'${value/1e3:.0f}K'
+    else:
+        return f'${value:.0f}'
+
+
+def _ensure_datetime_dates(df):
+    """Parse df['date'] in place unless it is already datetime64 (as the loaders return it)"""
+    if not pd.api.types.is_datetime64_any_dtype(df['date']):
+        df['date'] = pd.to_datetime(df['date'])
+
+
+def _rows_from_date(df, start_date):
+    """Rows of df dated on or after start_date, selected with a raw datetime64 comparison"""
+    start = pd.Timestamp(start_date).to_datetime64()
+    return df.iloc[np.flatnonzero(df['date'].to_numpy() >= start)]
 
 
 def filter_and_deduplicate_data(df):
     """Filter valid data and remove duplicates for analysis"""
     print("Filtering and deduplicating data...")
     
-    # Filter out rows with missing or zero values
-    valid_data = df[(df['btc_balance'] > 0) & 
-                   (df['btc_per_diluted_share'] > 0) & 
-                   (df['btc_balance'].notna()) & 
-                   (df['btc_per_diluted_share'].notna())].copy()
+    # Filter out rows with missing or zero values (NaN compares False, so > 0 covers both)
+    btc_balance = df['btc_balance'].to_numpy()
+    valid_rows = np.flatnonzero((btc_balance > 0) & (df['btc_per_diluted_share'].to_numpy() > 0))
+    valid_data = df.iloc[valid_rows]
     
-    # Remove duplicates based on btc_balance (keeping first occurrence)
-    unique_data = valid_data.drop_duplicates(subset=['btc_balance'], keep='first')
+    # Remove duplicates based on btc_balance (keeping first occurrence); np.unique
+    # reports first-occurrence positions, sorted back into date order and mapped to df rows
+    _, first_idx = np.unique(btc_balance[valid_rows], return_index=True)
+    unique_data = df.iloc[valid_rows[np.sort(first_idx)]]
     duplicates = len(valid_data) - len(unique_data)
     
     print(f"Valid data points for log transformation: {len(valid_data)}")
@@ -221,42 +487,68 @@ def filter_and_deduplicate_data(df):
     return valid_data, unique_data, duplicates
 
 
+def _log10_positive(values):
+    """log10 of a Series in a single ufunc pass; non-positive or NaN entries become NaN"""
+    # Integer columns (whole-number sheet cells) are widened so the output can hold NaN
+    arr = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    logs = np.full(arr.shape, np.nan)
+    np.log10(arr, out=logs, where=arr > 0)
+    return pd.Series(logs, index=values.index, name=values.name)
+
+
 def perform_log_transformation(valid_data, unique_data):
     """Apply log10 transformation to the data"""
     print("\nUnique Bitcoin holding levels:")
     print(list(unique_data['btc_balance'].values))
     
     # Log transformation for all valid data
-    log_btc_balance = np.log10(valid_data['btc_balance'])
-    log_btc_per_diluted_share = np.log10(valid_data['btc_per_diluted_share'])
-    
-    # Log transformation for unique data only
-    log_btc_balance_unique = np.log10(unique_data['btc_balance'])
-    log_btc_per_diluted_share_unique = np.log10(unique_data['btc_per_diluted_share'])
+    log_btc_balance = _log10_positive(valid_data['btc_balance'])
+    log_btc_per_diluted_share = _log10_positive(valid_data['btc_per_diluted_share'])
+    
+    # Unique rows are a subset of the valid rows, so select their logs instead of recomputing.
+    # That selection is by index label, so a frame with repeated labels takes the logs directly
+    if valid_data.index.is_unique:
+        unique_mask = valid_data.index.isin(unique_data.index)
+        log_btc_balance_unique = log_btc_balance[unique_mask]
+        log_btc_per_diluted_share_unique = log_btc_per_diluted_share[unique_mask]
+    else:
+        log_btc_balance_unique = _log10_positive(unique_data['btc_balance'])
+        log_btc_per_diluted_share_unique = _log10_positive(unique_data['btc_per_diluted_share'])
     
     print("Log transformation completed for both all data and unique data")
     
     return log_btc_balance, log_btc_per_diluted_share, log_btc_balance_unique, log_btc_per_diluted_share_unique
 
 
+def _ols_fit(x, y):
+    """Closed-form OLS slope, intercept and R²; NaN when there are fewer than two distinct points"""
+    # A single holding level or constant data has zero variance; like sklearn, yield NaN not an error
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_dev = x - x.mean()
+        y_dev = y - y.mean()
+        slope = np.dot(x_dev, y_dev) / np.dot(x_dev, x_dev)
+        intercept = y.mean() - slope * x.mean()
+        residuals = y - (slope * x + intercept)
+        r2 = 1 - np.dot(residuals, residuals) / np.dot(y_dev, y_dev)
+    return slope, intercept, r2
+
+
 def fit_power_law_regression(log_btc_balance, log_btc_balance_unique, log_btc_per_diluted_share_unique, unique_data):
     """Fit linear regression on log-log data to find power law relationship"""
     print(f"\nFitting regression on unique datapoints only...")
     
-    # Fit linear regression on log-log data (unique points only)
-    X_unique = log_btc_balance_unique.values.reshape(-1, 1)
-    y_unique = log_btc_per_diluted_share_unique.values
-    
-    reg = LinearRegression()
-    reg.fit(X_unique, y_unique)
+    # Fit linear regression on log-log data (unique points only) with the closed-form
+    # OLS solution for a single feature: slope = cov(x, y) / var(x)
+    x_unique = log_btc_balance_unique.to_numpy(dtype=np.float64)
+    y_unique = log_btc_per_diluted_share_unique.to_numpy(dtype=np.float64)
     
-    # Generate prediction line for plotting (using full range)
-    X_plot = np.linspace(log_btc_balance.min(), log_btc_balance.max(), 100).reshape(-1, 1)
-    y_pred_plot = reg.predict(X_plot)
+    slope, intercept, r2 = _ols_fit(x_unique, y_unique)
+    reg = LinearFit(coef_=np.array([slope]), intercept_=intercept)
     
-    # Calculate R² for unique data
-    y_pred_unique = reg.predict(X_unique)
-    r2 = r2_score(y_unique, y_pred_unique)
+    # Generate prediction line for plotting (using full range); part of the public
+    # return value and of processed_data for custom chart generators
+    X_plot = np.linspace(log_btc_balance.min(), log_btc_balance.max(), 100)
+    y_pred_plot = slope * X_plot + intercept
     
     print(f"Regression fitted on {len(unique_data)} unique points")
     print(f"R² (unique data): {r2:.6f}")
@@ -274,7 +566,7 @@ def calculate_statistics(log_btc_balance_unique, log_btc_per_diluted_share_uniqu
     return correlation, slope, intercept, a_coeff
 
 
-def create_power_law_chart(df, company_name, config=None, output_dir=None):
+def create_power_law_chart(df, company_name, config=None, output_dir=None, precomputed=None):
     """Create and save the log-log chart with power law fit
     
     Args:
@@ -287,32 +579,32 @@ def create_power_law_chart(df, company_name, config=None, output_dir=None):
             - y_axis_label: Custom y-axis label (default: 'Bitcoin per {share_type}')
             - data_series_label: Custom data series label (default: '{company_name} Treasury Updates ({count})')
             - share_type: Type of shares (default: 'Fully Diluted Share')
+            - subtitle_date: Date shown in the subtitle (default: today)
+            - dpi: Resolution of the saved PNG (default: 150)
+            - png_compress_level: zlib level for the saved PNG (default: 3)
         output_dir (str, optional): Directory to save the chart
+        precomputed (dict, optional): processed_data from run_company_analysis for the same df
+            (only its log and fit entries are read); reuses them instead of recomputing
     """
+    plt = _get_pyplot()
     print("\nCreating Log-Log Chart with Fitted Power Law Function")
     print("=" * 70)
     
-    # Perform data transformations internally
-    valid_data, unique_data, duplicates = filter_and_deduplicate_data(df)
-    log_btc_balance, log_btc_per_diluted_share, log_btc_balance_unique, log_btc_per_diluted_share_unique = perform_log_transformation(valid_data, unique_data)
-    reg, y_pred_plot, r2 = fit_power_law_regression(log_btc_balance, log_btc_balance_unique, log_btc_per_diluted_share_unique, unique_data)
-    correlation, slope, intercept, a_coeff = calculate_statistics(log_btc_balance_unique, log_btc_per_diluted_share_unique, reg)
-
-    plt.figure(figsize=(12, 8))
-
-    # Get data series label with default
-    data_series_label = config.get('data_series_label', f'{company_name} Treasury Updates ({len(unique_data)})')
-    
-    # Highlight unique points used for regression
-    plt.scatter(log_btc_balance_unique, log_btc_per_diluted_share_unique,
-                alpha=0.9, s=80, c='#ff0000', edgecolors='#8b0a1a', linewidth=1,
-                label=data_series_label, zorder=5)
-
-    # Plot fitted line
-    X_plot = np.linspace(log_btc_balance.min(), log_btc_balance.max(), 100)
-    y_pred_plot = slope * X_plot + np.log10(a_coeff)
-    plt.plot(X_plot, y_pred_plot,
-             '#ff0000', linewidth=3, label='Fitted Power Law', alpha=0.8, zorder=4)
+    if precomputed is not None:
+        log_btc_balance = precomputed['log_btc_balance']
+        log_btc_balance_unique = precomputed['log_btc_balance_unique']
+        log_btc_per_diluted_share_unique = precomputed['log_btc_per_diluted_share_unique']
+        correlation = precomputed['correlation']
+        slope = precomputed['slope']
+        intercept = precomputed['intercept']
+        a_coeff = precomputed['a_coeff']
+        r2 = precomputed['r2']
+    else:
+        # Perform data transformations internally
+        valid_data, unique_data, duplicates = filter_and_deduplicate_data(df)
+        log_btc_balance, log_btc_per_diluted_share, log_btc_balance_unique, log_btc_per_diluted_share_unique = perform_log_transformation(valid_data, unique_data)
+        reg, y_pred_plot, r2 = fit_power_law_regression(log_btc_balance, log_btc_balance_unique, log_btc_per_diluted_share_unique, unique_data)
+        correlation, slope, intercept, a_coeff = calculate_statistics(log_btc_balance_unique, log_btc_per_diluted_share_unique, reg)
 
     # Get configuration values with defaults
     if config is None:
@@ -321,20 +613,33 @@ def create_power_law_chart(df, company_name, config=None, output_dir=None):
     share_type = config.get('share_type', 'Fully Diluted Share')
     x_axis_label = config.get('x_axis_label', 'Bitcoin Holdings (BTC)')
     y_axis_label = config.get('y_axis_label', f'Bitcoin per {share_type}')
+    data_series_label = config.get('data_series_label', f'{company_name} Treasury Updates ({len(log_btc_balance_unique)})')
     
     # Get current date for subtitle
-    from datetime import datetime
-    current_date = datetime.now().strftime('%Y-%m-%d')
+    current_date = config.get('subtitle_date') or time.strftime('%Y-%m-%d')
     
     chart_title = config.get('chart_title', f'{company_name} Log-Log BTC Holdings vs Bitcoin per {share_type}')
     chart_subtitle = config.get('chart_subtitle', f'https://btctcs.com - {current_date}')
-    
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    # Highlight unique points used for regression
+    ax.scatter(log_btc_balance_unique, log_btc_per_diluted_share_unique,
+               alpha=0.9, s=80, c='#ff0000', edgecolors='#8b0a1a', linewidth=1,
+               label=data_series_label, zorder=5)
+
+    # Plot fitted line; a straight line in log-log space only needs its two endpoints
+    X_plot = np.array([log_btc_balance.min(), log_btc_balance.max()])
+    y_pred_plot = slope * X_plot + intercept
+    ax.plot(X_plot, y_pred_plot,
+            '#ff0000', linewidth=3, label='Fitted Power Law', alpha=0.8, zorder=4)
+
     # Labels and title
-    plt.xlabel(x_axis_label, fontsize=14, fontweight='bold')
-    plt.ylabel(y_axis_label, fontsize=14, fontweight='bold')
+    ax.set_xlabel(x_axis_label, fontsize=14, fontweight='bold')
+    ax.set_ylabel(y_axis_label, fontsize=14, fontweight='bold')
     
-    plt.suptitle(chart_title, fontsize=16, fontweight='bold', y=0.98)
-    plt.title(chart_subtitle, fontsize=12, pad=10)
+    fig.suptitle(chart_title, fontsize=16, fontweight='bold', y=0.98)
+    ax.set_title(chart_subtitle, fontsize=12, pad=10)
 
     # Create equation text
     equation_text = f'Power Law: y = {a_coeff:.2e} × x^{slope:.3f}'
@@ -343,13 +648,13 @@ def create_power_law_chart(df, company_name, config=None, output_dir=None):
     # Add text box with equation and statistics
     textstr = f'{equation_text}\n{stats_text}'
     props = dict(boxstyle='round', facecolor='wheat', alpha=0.8)
-    plt.text(0.05, 0.95, textstr, transform=plt.gca().transAxes, fontsize=10,
-             verticalalignment='top', bbox=props)
+    ax.text(0.05, 0.95, textstr, transform=ax.transAxes, fontsize=10,
+            verticalalignment='top', bbox=props)
 
     # Add legend and grid
-    plt.legend(loc='lower right')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
+    ax.legend(loc='lower right')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
 
     # Save the plot with customizable filename
     filename_base = config.get('filename', f'{company_name.lower()}_log_log_btc_holdings_vs_btc_per_share')
@@ -358,8 +663,11 @@ def create_power_law_chart(df, company_name, config=None, output_dir=None):
         filepath = os.path.join(output_dir, filename)
     else:
         filepath = filename
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _save_chart(fig, filepath, config)
+    if not output_dir:
+        plt.show()
+    plt.close(fig)
+    return filepath
 
 
 def create_stock_nav_chart(df, company_name, config, output_dir=None):
@@ -377,50 +685,52 @@ def create_stock_nav_chart(df, company_name, config, output_dir=None):
             - x_axis_label: Custom x-axis label (default: 'Date')
             - y_axis_label: Custom y-axis label (default: 'Price (USD)')
             - share_type: Type of shares (default: 'Fully Diluted Share')
+            - subtitle_date: Date shown in the subtitle (default: today)
+            - dpi: Resolution of the saved PNG (default: 150)
+            - png_compress_level: zlib level for the saved PNG (default: 3)
         output_dir (str, optional): Directory to save the chart
     """
+    plt = _get_pyplot()
     print("\nCreating Stock Price vs NAV Multipliers Per Share Chart")
     print("=" * 60)
 
-    plt.figure(figsize=(14, 10))
+    _ensure_datetime_dates(df)
 
-    # Convert date column to datetime
-    df['date'] = pd.to_datetime(df['date'])
-    
     # Apply global start date filter if specified
     global_start_date = config.get('global_start_date')
     if global_start_date:
-        filter_date = pd.to_datetime(global_start_date)
-        df = df[df['date'] >= filter_date].copy()
+        df = _rows_from_date(df, global_start_date)
         
         if len(df) == 0:
             print(f"No data available from {global_start_date} onwards for stock NAV chart")
             return
     
-    # Calculate NAV (Net Asset Value) = BTC Balance * BTC Price
-    df['nav'] = df['btc_balance'] * df['btc_prices']
+    fig, ax = plt.subplots(figsize=(14, 10))
+
+    arrays = CompanyArrays.from_dataframe(df)
+
+    # NAV (Net Asset Value) = BTC Balance * BTC Price
+    nav = arrays.get_nav()
     
     # Get NAV reference levels and colors from config
     nav_levels = config.get('nav_reference_levels', [3, 5, 7])
     nav_colors = config.get('nav_reference_colors', ['#0000ff', '#008000', '#ff0000'])
     projection_months = config.get('projection_months', 2)
     
-    # Calculate NAV multipliers per share (divide by diluted shares outstanding)
-    nav_columns = {}
-    for level in nav_levels:
-        column_name = f'nav_{level}x_per_share'
-        df[column_name] = (df['nav'] * level) / df['diluted_shares_outstanding']
-        nav_columns[level] = column_name
+    # NAV per share; each reference level is a scale of this single division
+    base_nav_per_share = nav / arrays.diluted_shares_outstanding
     
-    # Calculate 30-day average daily bitcoin yield
-    last_30_days = df.tail(30)  # Get last 30 days of data
+    # Calculate 30-day average daily bitcoin yield (last 30 rows, or all available data)
+    last_30_days = arrays.btc_balance[-30:]
     if len(last_30_days) < 2:
-        # If we don't have enough data, use all available data
-        last_30_days = df
-    
-    # Calculate daily bitcoin balance changes
-    btc_changes = last_30_days['btc_balance'].diff().dropna()
-    daily_btc_yield = btc_changes.mean()
+        # Not enough data for a change; project a flat balance
+        daily_btc_yield = 0.0
+    elif np.isnan(last_30_days).any():
+        # Gaps break the telescoping sum; average the changes that are defined
+        daily_btc_yield = np.nanmean(np.diff(last_30_days))
+    else:
+        # The mean of consecutive differences telescopes to (last - first) / (n - 1)
+        daily_btc_yield = (last_30_days[-1] - last_30_days[0]) / (len(last_30_days) - 1)
     
     # Extend time axis based on projection_months
     last_date = df['date'].max()
@@ -429,44 +739,39 @@ def create_stock_nav_chart(df, company_name, config, output_dir=None):
                                 periods=projection_days, freq='D')
     
     # Get the last values for projection
-    last_btc_balance = df['btc_balance'].iloc[-1]
-    last_btc_price = df['btc_prices'].iloc[-1]
-    last_diluted_shares = df['diluted_shares_outstanding'].iloc[-1]
+    last_btc_balance = arrays.btc_balance[-1]
+    last_btc_price = arrays.btc_prices[-1]
+    last_diluted_shares = arrays.diluted_shares_outstanding[-1]
     
-    # Project future bitcoin accumulation and NAV per share
-    future_nav_per_share = {level: [] for level in nav_levels}
+    # Project future bitcoin accumulation and NAV per share as a linear ramp
+    days_ahead = np.arange(1, len(future_dates) + 1)
+    projected_btc_balance = last_btc_balance + (daily_btc_yield * days_ahead)
     
-    for i, future_date in enumerate(future_dates):
-        days_ahead = i + 1
-        projected_btc_balance = last_btc_balance + (daily_btc_yield * days_ahead)
-        
-        # Assume bitcoin price stays constant for projection (could be enhanced with price models)
-        projected_nav = projected_btc_balance * last_btc_price
-        
-        # Calculate NAV multipliers per share
-        for level in nav_levels:
-            nav_per_share = (projected_nav * level) / last_diluted_shares
-            future_nav_per_share[level].append(nav_per_share)
+    # Assume bitcoin price stays constant for projection (could be enhanced with price models)
+    projected_nav = projected_btc_balance * last_btc_price
+    
+    # Calculate NAV multipliers per share: one column per level
+    projected_nav_per_share = np.outer(projected_nav / last_diluted_shares, nav_levels)
     
     # Plot historical stock price (dotted line)
-    plt.plot(df['date'], df['stock_prices'], '#000000', linestyle='--', linewidth=2, 
-             label=f'{company_name} Stock Price (USD)', alpha=0.8)
+    ax.plot(arrays.dates, arrays.stock_prices, '#000000', linestyle='--', linewidth=2, 
+            label=f'{company_name} Stock Price (USD)', alpha=0.8)
     
     # Plot NAV multipliers per share (solid lines)
     for i, level in enumerate(nav_levels):
         color = nav_colors[i % len(nav_colors)]
         
         # Historical data
-        plt.plot(df['date'], df[nav_columns[level]], color, linewidth=2, 
-                 label=f'{level}x NAV per {config.get("share_type", "Fully Diluted Share")}', alpha=0.8)
+        ax.plot(arrays.dates, base_nav_per_share * level, color, linewidth=2, 
+                label=f'{level}x NAV per {config.get("share_type", "Fully Diluted Share")}', alpha=0.8)
         
         # Future projection (dashed line)
-        plt.plot(future_dates, future_nav_per_share[level], color, linestyle='--', 
-                 linewidth=2, alpha=0.6)
+        ax.plot(future_dates, projected_nav_per_share[:, i], color, linestyle='--', 
+                linewidth=2, alpha=0.6)
     
     # Add vertical line to separate historical from projected data
-    plt.axvline(x=last_date, color='#808080', linestyle=':', alpha=0.7, 
-                label='Projection Start')
+    ax.axvline(x=last_date, color='#808080', linestyle=':', alpha=0.7, 
+               label='Projection Start')
 
     # Labels and title (will be set after config is processed)
     
@@ -476,38 +781,32 @@ def create_stock_nav_chart(df, company_name, config, output_dir=None):
     y_axis_label = config.get('y_axis_label', 'Price (USD)')
     
     # Get current date for subtitle
-    from datetime import datetime
-    current_date = datetime.now().strftime('%Y-%m-%d')
+    current_date = config.get('subtitle_date') or time.strftime('%Y-%m-%d')
     
     chart_title = config.get('chart_title', f'{company_name} Stock Price vs BTC NAV Multipliers per {share_type}')
     chart_subtitle = config.get('chart_subtitle', f'https://btctcs.com - {current_date}')
     
-    plt.suptitle(chart_title, fontsize=16, fontweight='bold', y=0.98)
-    plt.title(chart_subtitle, fontsize=12, pad=10)
+    fig.suptitle(chart_title, fontsize=16, fontweight='bold', y=0.98)
+    ax.set_title(chart_subtitle, fontsize=12, pad=10)
     
     # Set axis labels
-    plt.xlabel(x_axis_label, fontsize=14, fontweight='bold')
-    plt.ylabel(y_axis_label, fontsize=14, fontweight='bold')
+    ax.set_xlabel(x_axis_label, fontsize=14, fontweight='bold')
+    ax.set_ylabel(y_axis_label, fontsize=14, fontweight='bold')
 
     # Set log scale for y-axis
-    plt.yscale('log')
+    ax.set_yscale('log')
     
     # Format y-axis to avoid scientific notation
     from matplotlib.ticker import FuncFormatter
-    def format_func(value, tick_number):
-        if value >= 1:
-            return f'${value:.2f}'
-        else:
-            return f'${value:.4f}'
-    plt.gca().yaxis.set_major_formatter(FuncFormatter(format_func))
+    ax.yaxis.set_major_formatter(FuncFormatter(_format_dollar_tick))
     
     # Add legend and grid
-    plt.legend(loc='upper left', fontsize=12)
-    plt.grid(True, alpha=0.3)
+    ax.legend(loc='upper left', fontsize=12)
+    ax.grid(True, alpha=0.3)
     
     # Format x-axis dates
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
 
     # Save the plot with customizable filename
     filename_base = config.get('filename', f'{company_name.lower()}_stock_price_vs_bitcoin_nav_multiples')
@@ -516,25 +815,25 @@ def create_stock_nav_chart(df, company_name, config, output_dir=None):
         filepath = os.path.join(output_dir, filename)
     else:
         filepath = filename
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _save_chart(fig, filepath, config)
+    if not output_dir:
+        plt.show()
+    plt.close(fig)
+    return filepath
 
 
 def create_mnav_chart(df, company_name, config, output_dir=None):
     """Create mNAV chart showing stock price as multiple of NAV"""
+    plt = _get_pyplot()
     print("\nCreating mNAV Chart (Stock Price Multiple of NAV)")
     print("=" * 60)
 
-    plt.figure(figsize=(14, 10))
+    _ensure_datetime_dates(df)
 
-    # Convert date column to datetime
-    df['date'] = pd.to_datetime(df['date'])
-    
     # Apply global start date filter first if specified
     global_start_date = config.get('global_start_date')
     if global_start_date:
-        filter_date = pd.to_datetime(global_start_date)
-        df = df[df['date'] >= filter_date].copy()
+        df = _rows_from_date(df, global_start_date)
         
         if len(df) == 0:
             print(f"No data available from {global_start_date} onwards for mNAV chart")
@@ -547,72 +846,74 @@ def create_mnav_chart(df, company_name, config, output_dir=None):
     
     # Filter data from mnav_start_date onwards if provided (additional to global filter)
     if start_date:
-        filter_date = pd.to_datetime(start_date)
-        df_filtered = df[df['date'] >= filter_date].copy()
+        df_filtered = _rows_from_date(df, start_date)
         
         if len(df_filtered) == 0:
             print(f"No data available from {start_date} onwards")
             return
     else:
         # Use all available data if no mnav start date specified
-        df_filtered = df.copy()
+        df_filtered = df
     
-    # Calculate NAV (Net Asset Value) = BTC Balance * BTC Price
-    df_filtered['nav'] = df_filtered['btc_balance'] * df_filtered['btc_prices']
+    fig, ax = plt.subplots(figsize=(14, 10))
+
+    arrays = CompanyArrays.from_dataframe(df_filtered)
+
+    # NAV (Net Asset Value) = BTC Balance * BTC Price
+    nav = arrays.get_nav()
     
-    # Calculate fully diluted market cap manually = Diluted Shares Outstanding * Stock Price
-    df_filtered['fully_diluted_market_cap'] = df_filtered['diluted_shares_outstanding'] * df_filtered['stock_prices']
+    # Fully diluted market cap = Diluted Shares Outstanding * Stock Price
+    fully_diluted_market_cap = arrays.get_fully_diluted_market_cap()
     
     # Calculate mNAV (multiple of NAV) = Fully Diluted Market Cap / Bitcoin NAV
-    df_filtered['mnav'] = df_filtered['fully_diluted_market_cap'] / df_filtered['nav']
+    mnav = fully_diluted_market_cap / nav
     
-    print(f"Filtered data from {df_filtered['date'].min().strftime('%Y-%m-%d')} to {df_filtered['date'].max().strftime('%Y-%m-%d')}")
-    print(f"mNAV range: {df_filtered['mnav'].min():.2f}x to {df_filtered['mnav'].max():.2f}x")
+    print(f"Filtered data from {_format_date_range(arrays.dates)}")
+    print(f"mNAV range: {np.nanmin(mnav):.2f}x to {np.nanmax(mnav):.2f}x")
     
     # Plot historical mNAV (solid line)
-    plt.plot(df_filtered['date'], df_filtered['mnav'], '#0000ff', linewidth=2, 
-             label=f'{company_name} Stock Price Multiple of Bitcoin NAV', alpha=0.8)
+    ax.plot(arrays.dates, mnav, '#0000ff', linewidth=2, 
+            label=f'{company_name} Stock Price Multiple of Bitcoin NAV', alpha=0.8)
 
     # Labels and title
-    plt.xlabel('Date', fontsize=14, fontweight='bold')
-    plt.ylabel('Multiple of NAV (mNAV)', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Date', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Multiple of NAV (mNAV)', fontsize=14, fontweight='bold')
     
     # Get current date for subtitle
-    from datetime import datetime
-    current_date = datetime.now().strftime('%Y-%m-%d')
+    current_date = config.get('subtitle_date') or time.strftime('%Y-%m-%d')
     
     # Get the most recent mNAV value for labeling
-    most_recent_mnav = df_filtered['mnav'].iloc[-1]
+    most_recent_mnav = mnav[-1]
     most_recent_date = df_filtered['date'].iloc[-1]
     
-    plt.suptitle(f'{company_name} Stock Price as Multiple of BTC NAV',
+    fig.suptitle(f'{company_name} Stock Price as Multiple of BTC NAV',
                  fontsize=16, fontweight='bold', y=0.98)
-    plt.title(f'(From {start_date if start_date else "beginning"})\nhttps://btctcs.com - {current_date}',
-              fontsize=12, pad=10)
+    ax.set_title(f'(From {start_date if start_date else "beginning"})\nhttps://btctcs.com - {current_date}',
+                 fontsize=12, pad=10)
 
     # Add NAV reference lines with matching colors from stock NAV chart
     for i, level in enumerate(nav_levels):
         color = nav_colors[i] if i < len(nav_colors) else f'C{i}'
-        plt.axhline(y=level, color=color, linestyle='--', alpha=0.7, label=f'{level}x NAV')
+        ax.axhline(y=level, color=color, linestyle='--', alpha=0.7, label=f'{level}x NAV')
     
     # Add a data point dot on the most recent mNAV value
-    plt.plot(most_recent_date, most_recent_mnav, '#0000ff', markersize=8, zorder=5)
+    ax.plot(most_recent_date, most_recent_mnav, '#0000ff', markersize=8, zorder=5)
     
     # Add annotation for the most recent mNAV value
-    plt.annotate(f'{most_recent_mnav:.2f}x', 
-                xy=(most_recent_date, most_recent_mnav),
-                xytext=(10, 10), textcoords='offset points',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7),
-                fontsize=10, fontweight='bold', color='black',
-                ha='left', va='bottom')
+    ax.annotate(f'{most_recent_mnav:.2f}x', 
+               xy=(most_recent_date, most_recent_mnav),
+               xytext=(10, 10), textcoords='offset points',
+               bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7),
+               fontsize=10, fontweight='bold', color='black',
+               ha='left', va='bottom')
 
     # Add legend and grid
-    plt.legend(loc='upper left', fontsize=12)
-    plt.grid(True, alpha=0.3)
+    ax.legend(loc='upper left', fontsize=12)
+    ax.grid(True, alpha=0.3)
     
     # Format x-axis dates
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
 
     # Save the plot
     filename = f'{company_name.lower()}_stock_price_multiple_of_bitcoin_nav.png'
@@ -620,8 +921,11 @@ def create_mnav_chart(df, company_name, config, output_dir=None):
         filepath = os.path.join(output_dir, filename)
     else:
         filepath = filename
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _save_chart(fig, filepath, config)
+    if not output_dir:
+        plt.show()
+    plt.close(fig)
+    return filepath
 
 
 def create_stacked_mc_btc_nav_chart(df, company_name, config, output_dir=None):
@@ -636,37 +940,41 @@ def create_stacked_mc_btc_nav_chart(df, company_name, config, output_dir=None):
             - x_axis_label: Custom x-axis label (default: 'Date')
             - y_axis_label: Custom y-axis label (default: 'Value (USD)')
             - share_type: Type of shares (default: 'Fully Diluted Share')
+            - subtitle_date: Date shown in the subtitle (default: today)
+            - dpi: Resolution of the saved PNG (default: 150)
+            - png_compress_level: zlib level for the saved PNG (default: 3)
             - market_cap_label: Label for market cap series (default: '{share_type} Market Cap')
             - nav_label: Label for NAV series (default: 'Bitcoin Net Asset Value')
         output_dir (str, optional): Directory to save the chart
     """
+    plt = _get_pyplot()
     print("\nCreating Stacked Area Chart (Market Cap vs Bitcoin NAV)")
     print("=" * 60)
 
-    plt.figure(figsize=(14, 10))
+    _ensure_datetime_dates(df)
 
-    # Convert date column to datetime
-    df['date'] = pd.to_datetime(df['date'])
-    
     # Apply global start date filter if specified
     global_start_date = config.get('global_start_date')
     if global_start_date:
-        filter_date = pd.to_datetime(global_start_date)
-        df = df[df['date'] >= filter_date].copy()
+        df = _rows_from_date(df, global_start_date)
         
         if len(df) == 0:
             print(f"No data available from {global_start_date} onwards for stacked area chart")
             return
     
-    # Calculate NAV (Net Asset Value) = BTC Balance * BTC Price
-    df['bitcoin_nav'] = df['btc_balance'] * df['btc_prices']
+    fig, ax = plt.subplots(figsize=(14, 10))
+
+    arrays = CompanyArrays.from_dataframe(df)
+
+    # NAV (Net Asset Value) = BTC Balance * BTC Price
+    bitcoin_nav = arrays.get_nav()
     
-    # Calculate fully diluted market cap = Diluted Shares Outstanding * Stock Price
-    df['fully_diluted_market_cap'] = df['diluted_shares_outstanding'] * df['stock_prices']
+    # Fully diluted market cap = Diluted Shares Outstanding * Stock Price
+    fully_diluted_market_cap = arrays.get_fully_diluted_market_cap()
     
-    print(f"Data range: {df['date'].min().strftime('%Y-%m-%d')} to {df['date'].max().strftime('%Y-%m-%d')}")
-    print(f"Market cap range: ${df['fully_diluted_market_cap'].min():,.0f} to ${df['fully_diluted_market_cap'].max():,.0f}")
-    print(f"Bitcoin NAV range: ${df['bitcoin_nav'].min():,.0f} to ${df['bitcoin_nav'].max():,.0f}")
+    print(f"Data range: {_format_date_range(arrays.dates)}")
+    print(f"Market cap range: ${np.nanmin(fully_diluted_market_cap):,.0f} to ${np.nanmax(fully_diluted_market_cap):,.0f}")
+    print(f"Bitcoin NAV range: ${np.nanmin(bitcoin_nav):,.0f} to ${np.nanmax(bitcoin_nav):,.0f}")
     
     # Get configuration values with defaults
     share_type = config.get('share_type', 'Fully Diluted Share')
@@ -674,55 +982,48 @@ def create_stacked_mc_btc_nav_chart(df, company_name, config, output_dir=None):
     nav_label = config.get('nav_label', 'Bitcoin Net Asset Value')
     
     # Create stacked area chart
-    plt.fill_between(df['date'], 0, df['fully_diluted_market_cap'], 
-                     alpha=0.7, color='#add8e6', label=market_cap_label)
-    plt.fill_between(df['date'], 0, df['bitcoin_nav'], 
-                     alpha=0.7, color='#ffa07a', label=nav_label)
+    ax.fill_between(arrays.dates, 0, fully_diluted_market_cap, 
+                    alpha=0.7, color='#add8e6', label=market_cap_label)
+    ax.fill_between(arrays.dates, 0, bitcoin_nav, 
+                    alpha=0.7, color='#ffa07a', label=nav_label)
     
     # Plot the lines on top for clarity
-    plt.plot(df['date'], df['fully_diluted_market_cap'], '#0000ff', linewidth=2, alpha=0.8)
-    plt.plot(df['date'], df['bitcoin_nav'], '#ff0000', linewidth=2, alpha=0.8)
+    ax.plot(arrays.dates, fully_diluted_market_cap, '#0000ff', linewidth=2, alpha=0.8)
+    ax.plot(arrays.dates, bitcoin_nav, '#ff0000', linewidth=2, alpha=0.8)
     
     # Find intersection point: where historical market cap equals current bitcoin NAV
-    current_bitcoin_nav = df['bitcoin_nav'].iloc[-1]
+    current_bitcoin_nav = bitcoin_nav[-1]
     current_date = df['date'].iloc[-1]
     
     # Find the most recent date where market cap crossed above current bitcoin NAV
-    # Look for the most recent transition from below to above current NAV
-    intersection_idx = None
-    for i in range(len(df) - 1, 0, -1):  # Start from end, go backwards, stop at index 1
-        current_market_cap = df['fully_diluted_market_cap'].iloc[i]
-        previous_market_cap = df['fully_diluted_market_cap'].iloc[i-1]
-        
-        # Check if this is a crossing point: previous was below, current is above
-        if (previous_market_cap < current_bitcoin_nav and 
-            current_market_cap >= current_bitcoin_nav):
-            intersection_idx = i
-            break
+    # Crossing points: previous was below, current is at or above current NAV
+    crossings = np.flatnonzero((fully_diluted_market_cap[:-1] < current_bitcoin_nav) &
+                               (fully_diluted_market_cap[1:] >= current_bitcoin_nav))
+    intersection_idx = crossings[-1] + 1 if crossings.size else None
     
     if intersection_idx is not None:
         intersection_date = df['date'].iloc[intersection_idx]
-        intersection_market_cap = df['fully_diluted_market_cap'].iloc[intersection_idx]
+        intersection_market_cap = fully_diluted_market_cap[intersection_idx]
         
         # Calculate days between intersection and current date
         days_difference = (current_date - intersection_date).days
         
         # Draw dashed line from crossing point to current bitcoin NAV (flat line at current NAV level)
-        plt.plot([intersection_date, current_date], 
-                 [current_bitcoin_nav, current_bitcoin_nav], 
-                 '#ff0000', linestyle='--', linewidth=2, alpha=0.8)
+        ax.plot([intersection_date, current_date], 
+                [current_bitcoin_nav, current_bitcoin_nav], 
+                '#ff0000', linestyle='--', linewidth=2, alpha=0.8)
         
         # Add annotation for the dashed line
         mid_date = intersection_date + (current_date - intersection_date) / 2
-        plt.annotate(f'{days_difference} days', 
-                    xy=(mid_date, current_bitcoin_nav),
-                    xytext=(0, 20), textcoords='offset points',
-                    bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
-                    fontsize=10, fontweight='bold', ha='center', color='black')
+        ax.annotate(f'{days_difference} days', 
+                   xy=(mid_date, current_bitcoin_nav),
+                   xytext=(0, 20), textcoords='offset points',
+                   bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.8),
+                   fontsize=10, fontweight='bold', ha='center', color='black')
         
         # Add markers at intersection points
-        plt.plot(intersection_date, current_bitcoin_nav, '#0000ff', markersize=8, zorder=5)
-        plt.plot(current_date, current_bitcoin_nav, '#0000ff', markersize=8, zorder=5)
+        ax.plot(intersection_date, current_bitcoin_nav, '#0000ff', markersize=8, zorder=5)
+        ax.plot(current_date, current_bitcoin_nav, '#0000ff', markersize=8, zorder=5)
     else:
         # If no crossing found, set default values
         days_difference = 0
@@ -733,40 +1034,32 @@ def create_stacked_mc_btc_nav_chart(df, company_name, config, output_dir=None):
     y_axis_label = config.get('y_axis_label', 'Value (USD)')
     
     # Get current date for subtitle
-    from datetime import datetime
-    chart_date = datetime.now().strftime('%Y-%m-%d')
+    chart_date = config.get('subtitle_date') or time.strftime('%Y-%m-%d')
     
     chart_title = config.get('chart_title', f'{company_name} Market Cap vs Bitcoin NAV Over Time')
     chart_subtitle = config.get('chart_subtitle', f'https://btctcs.com - {chart_date}')
     
     # Labels and title
-    plt.xlabel(x_axis_label, fontsize=14, fontweight='bold')
-    plt.ylabel(y_axis_label, fontsize=14, fontweight='bold')
+    ax.set_xlabel(x_axis_label, fontsize=14, fontweight='bold')
+    ax.set_ylabel(y_axis_label, fontsize=14, fontweight='bold')
     
-    plt.suptitle(chart_title, fontsize=16, fontweight='bold', y=0.98)
-    plt.title(chart_subtitle, fontsize=12, pad=20)
+    fig.suptitle(chart_title, fontsize=16, fontweight='bold', y=0.98)
+    ax.set_title(chart_subtitle, fontsize=12, pad=20)
 
     # Format y-axis to show values in millions without scientific notation
     from matplotlib.ticker import FuncFormatter
-    def format_millions(value, tick_number):
-        if value >= 1e6:
-            return f'${value/1e6:.1f}M'
-        elif value >= 1e3:
-            return f'${value/1e3:.0f}K'
-        else:
-            return f'${value:.0f}'
-    plt.gca().yaxis.set_major_formatter(FuncFormatter(format_millions))
+    ax.yaxis.set_major_formatter(FuncFormatter(_format_millions_tick))
     
     # Set log scale for y-axis
-    plt.yscale('log')
+    ax.set_yscale('log')
     
     # Add legend and grid
-    plt.legend(loc='upper left', fontsize=12)
-    plt.grid(True, alpha=0.3)
+    ax.legend(loc='upper left', fontsize=12)
+    ax.grid(True, alpha=0.3)
     
     # Format x-axis dates
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
 
     # Save the plot with customizable filename
     filename_base = config.get('filename', f'{company_name.lower()}_market_cap_vs_bitcoin_nav_stacked')
@@ -775,9 +1068,12 @@ def create_stacked_mc_btc_nav_chart(df, company_name, config, output_dir=None):
         filepath = os.path.join(output_dir, filename)
     else:
         filepath = filename
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
+    _save_chart(fig, filepath, config)
     print(f"Intersection found: {days_difference} days ago (Market Cap: ${intersection_market_cap:,.0f}, Current Bitcoin NAV: ${current_bitcoin_nav:,.0f})")
-    plt.show()
+    if not output_dir:
+        plt.show()
+    plt.close(fig)
+    return filepath
 
 
 def create_btc_per_share_chart(df, company_name, config, output_dir=None):
@@ -792,35 +1088,38 @@ def create_btc_per_share_chart(df, company_name, config, output_dir=None):
     - x_axis_label: Custom x-axis label (default: 'Date')
     - y_axis_label: Custom y-axis label (default: 'Sats per {share_type}')
     - share_type: Type of shares (default: 'Fully Diluted Share')
+    - subtitle_date: Date shown in the subtitle (default: today)
+    - dpi: Resolution of the saved PNG (default: 150)
+    - png_compress_level: zlib level for the saved PNG (default: 3)
     """
+    plt = _get_pyplot()
+
     # Get share type for print message
     share_type = config.get('share_type', 'Fully Diluted Share')
     print(f"\nCreating Sats per {share_type} Over Time Chart")
     print("=" * 60)
 
-    plt.figure(figsize=(14, 10))
+    _ensure_datetime_dates(df)
 
-    # Convert date column to datetime
-    df['date'] = pd.to_datetime(df['date'])
-    
     # Apply global start date filter if specified
     global_start_date = config.get('global_start_date')
     if global_start_date:
-        filter_date = pd.to_datetime(global_start_date)
-        df = df[df['date'] >= filter_date].copy()
+        df = _rows_from_date(df, global_start_date)
         
         if len(df) == 0:
             print(f"No data available from {global_start_date} onwards for sats per {share_type} chart")
             return
     
+    fig, ax = plt.subplots(figsize=(14, 10))
+
     # Get configuration for multiple data series
     btc_per_share_columns = config.get('btc_per_share_columns', ['btc_per_diluted_share'])
     btc_per_share_labels = config.get('btc_per_share_labels', None)
     btc_per_share_colors = config.get('btc_per_share_colors', ['#0000ff', '#ff6600', '#00aa00', '#ff0000', '#9900cc'])
     
-    # Ensure we have enough colors
-    while len(btc_per_share_colors) < len(btc_per_share_columns):
-        btc_per_share_colors.extend(['#0000ff', '#ff6600', '#00aa00', '#ff0000', '#9900cc'])
+    # Dates are shared by every series; extract them once
+    dates = df['date'].to_numpy()
+    annotations = []
     
     # Plot each data series
     for i, column in enumerate(btc_per_share_columns):
@@ -829,7 +1128,7 @@ def create_btc_per_share_chart(df, company_name, config, output_dir=None):
             continue
             
         # Convert Bitcoin per diluted share to sats per diluted share (multiply by 100,000,000)
-        sats_per_diluted_share = df[column] * 100_000_000
+        sats_per_diluted_share = df[column].to_numpy() * 100_000_000
         
         # Determine label for this series
         if btc_per_share_labels and i < len(btc_per_share_labels):
@@ -838,24 +1137,22 @@ def create_btc_per_share_chart(df, company_name, config, output_dir=None):
             # Use column name as label, cleaned up
             label = column.replace('_', ' ').title()
         
-        # Get color for this series
-        color = btc_per_share_colors[i]
+        # Get color for this series, cycling through the palette (never mutating the caller's list)
+        color = btc_per_share_colors[i % len(btc_per_share_colors)]
         
         # Plot historical sats per diluted share
-        plt.plot(df['date'], sats_per_diluted_share, color, linewidth=2, 
-                 label=label, alpha=0.8)
+        ax.plot(dates, sats_per_diluted_share, color, linewidth=2, 
+                label=label, alpha=0.8)
 
         # Store annotation data for intelligent positioning
         if len(sats_per_diluted_share) > 0:
-            most_recent_date = df['date'].iloc[-1]
-            most_recent_value = sats_per_diluted_share.iloc[-1]
+            most_recent_date = dates[-1]
+            most_recent_value = sats_per_diluted_share[-1]
             
             # Add a point marker for the most recent value
-            plt.plot(most_recent_date, most_recent_value, 'o', color=color, markersize=8, alpha=0.8)
+            ax.plot(most_recent_date, most_recent_value, 'o', color=color, markersize=8, alpha=0.8)
             
             # Store annotation info for later positioning
-            if 'annotations' not in locals():
-                annotations = []
             annotations.append({
                 'date': most_recent_date,
                 'value': most_recent_value,
@@ -864,101 +1161,53 @@ def create_btc_per_share_chart(df, company_name, config, output_dir=None):
                 'series_index': i
             })
 
-    # Add intelligent annotation positioning after all data series are plotted
-    if 'annotations' in locals() and annotations:
-        try:
-            # Sort annotations by value to handle positioning better
-            annotations.sort(key=lambda x: x['value'], reverse=True)
-            
-            # Get current axis limits to calculate relative positioning
-            ax = plt.gca()
-            y_min, y_max = ax.get_ylim()
-            x_min, x_max = ax.get_xlim()
-            
-            # Ensure we have positive values for log calculations
-            if y_min <= 0:
-                y_min = min([ann['value'] for ann in annotations]) * 0.5
-            if y_max <= 0:
-                y_max = max([ann['value'] for ann in annotations]) * 2
-            
-            # Convert dates to numeric for calculations
-            x_range = (x_max - x_min)
-            
-            # Safe log calculation
-            try:
-                y_range_log = np.log10(y_max) - np.log10(y_min)
-            except (ValueError, RuntimeWarning):
-                # Fallback to simple linear spacing if log fails
-                y_range_log = 1.0  # Default spacing
-            
-            # Track used positions to avoid overlaps
-            used_positions = []
-            
-            for i, ann in enumerate(annotations):
-                try:
-                    # Simple offset-based positioning (more reliable)
-                    x_offset = 15 + (i * 5)  # Pixels to the right
-                    y_offset = 10 + (i * 20)  # Pixels up/down alternating
-                    if i % 2 == 1:
-                        y_offset = -y_offset  # Alternate above/below
-                    
-                    # Create the annotation with simpler positioning
-                    plt.annotate(ann['text'],
-                                xy=(ann['date'], ann['value']),  # Point to annotate
-                                xytext=(x_offset, y_offset), textcoords='offset points',
-                                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                                        edgecolor=ann['color'], alpha=0.9, linewidth=1.5),
-                                fontsize=9, fontweight='bold', color=ann['color'],
-                                ha='left', va='center',
-                                arrowprops=dict(arrowstyle='->', color=ann['color'], 
-                                              alpha=0.7, linewidth=1.5))
-                except Exception as e:
-                    print(f"Warning: Could not create annotation for {ann['text']}: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"Warning: Annotation system failed, using simple labels: {e}")
-            # Fallback to simple annotations without arrows
-            for i, ann in enumerate(annotations):
-                try:
-                    y_offset = 10 + (i * 25)
-                    plt.annotate(ann['text'], 
-                                xy=(ann['date'], ann['value']),
-                                xytext=(10, y_offset), textcoords='offset points',
-                                bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7),
-                                fontsize=10, fontweight='bold', color='black',
-                                ha='left', va='bottom')
-                except Exception:
-                    continue
+    # Add annotation labels after all data series are plotted
+    # Sort annotations by value so the offsets fan out from the highest series down
+    annotations.sort(key=lambda x: x['value'], reverse=True)
+    for i, ann in enumerate(annotations):
+        # Simple offset-based positioning
+        x_offset = 15 + (i * 5)  # Pixels to the right
+        y_offset = 10 + (i * 20)  # Pixels up/down alternating
+        if i % 2 == 1:
+            y_offset = -y_offset  # Alternate above/below
+        
+        ax.annotate(ann['text'],
+                    xy=(ann['date'], ann['value']),  # Point to annotate
+                    xytext=(x_offset, y_offset), textcoords='offset points',
+                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
+                              edgecolor=ann['color'], alpha=0.9, linewidth=1.5),
+                    fontsize=9, fontweight='bold', color=ann['color'],
+                    ha='left', va='center',
+                    arrowprops=dict(arrowstyle='->', color=ann['color'], 
+                                    alpha=0.7, linewidth=1.5))
 
     # Get configuration values with defaults
     x_axis_label = config.get('x_axis_label', 'Date')
     y_axis_label = config.get('y_axis_label', f'Sats per {share_type}')
     
     # Get current date for subtitle
-    from datetime import datetime
-    current_date = datetime.now().strftime('%Y-%m-%d')
+    current_date = config.get('subtitle_date') or time.strftime('%Y-%m-%d')
     
     chart_title = config.get('chart_title', f'{company_name} Sats per {share_type} Over Time')
     chart_subtitle = config.get('chart_subtitle', f'https://btctcs.com - {current_date}')
     
     # Labels and title
-    plt.xlabel(x_axis_label, fontsize=14, fontweight='bold')
-    plt.ylabel(y_axis_label, fontsize=14, fontweight='bold')
+    ax.set_xlabel(x_axis_label, fontsize=14, fontweight='bold')
+    ax.set_ylabel(y_axis_label, fontsize=14, fontweight='bold')
     
-    plt.suptitle(chart_title, fontsize=16, fontweight='bold', y=0.98)
-    plt.title(chart_subtitle, fontsize=12, pad=20)
+    fig.suptitle(chart_title, fontsize=16, fontweight='bold', y=0.98)
+    ax.set_title(chart_subtitle, fontsize=12, pad=20)
 
     # Set logarithmic y-axis
-    plt.yscale('log')
+    ax.set_yscale('log')
     
     # Add legend and grid
-    plt.legend(loc='upper left', fontsize=12)
-    plt.grid(True, alpha=0.3)
+    ax.legend(loc='upper left', fontsize=12)
+    ax.grid(True, alpha=0.3)
     
     # Format x-axis dates
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
 
     # Save the plot with customizable filename
     filename_base = config.get('filename', f'{company_name.lower()}_bitcoin_sats_per_share_over_time')
@@ -967,8 +1216,11 @@ def create_btc_per_share_chart(df, company_name, config, output_dir=None):
         filepath = os.path.join(output_dir, filename)
     else:
         filepath = filename
-    plt.savefig(filepath, dpi=300, bbox_inches='tight')
-    plt.show()
+    _save_chart(fig, filepath, config)
+    if not output_dir:
+        plt.show()
+    plt.close(fig)
+    return filepath
 
 
 def print_detailed_summary(df, valid_data, unique_data, duplicates, correlation, slope, a_coeff, r2, company_name):
@@ -997,10 +1249,11 @@ def create_power_law_generator(custom_colors=None, custom_title=None, custom_fil
             config['chart_title'] = custom_title
         if custom_filename is not None:
             config['filename'] = custom_filename
+        config['subtitle_date'] = processed_data.get('subtitle_date')
         # Add any additional kwargs to config
         config.update(kwargs)
         
-        create_power_law_chart(processed_data['df'], company_name, config, output_dir)
+        return create_power_law_chart(processed_data['df'], company_name, config, output_dir, precomputed=processed_data)
     return power_law_chart
 
 
@@ -1015,10 +1268,11 @@ def create_stock_nav_generator(nav_levels=None, nav_colors=None, projection_mont
         }
         if share_type is not None:
             config['share_type'] = share_type
+        config['subtitle_date'] = processed_data.get('subtitle_date')
         # Add any additional kwargs to config
         config.update(kwargs)
             
-        create_stock_nav_chart(processed_data['df'], company_name, config, output_dir)
+        return create_stock_nav_chart(processed_data['df'], company_name, config, output_dir)
     return stock_nav_chart
 
 
@@ -1035,10 +1289,11 @@ def create_mnav_generator(mnav_start_date=None, custom_colors=None, share_type=N
             config['mnav_start_date'] = mnav_start_date
         if share_type is not None:
             config['share_type'] = share_type
+        config['subtitle_date'] = processed_data.get('subtitle_date')
         # Add any additional kwargs to config
         config.update(kwargs)
         
-        create_mnav_chart(processed_data['df'], company_name, config, output_dir)
+        return create_mnav_chart(processed_data['df'], company_name, config, output_dir)
     return mnav_chart
 
 
@@ -1054,10 +1309,11 @@ def create_stacked_area_generator(custom_colors=None, show_intersection=True, sh
             config['custom_colors'] = custom_colors
         if not show_intersection:
             config['show_intersection'] = False
+        config['subtitle_date'] = processed_data.get('subtitle_date')
         # Add any additional kwargs to config
         config.update(kwargs)
         
-        create_stacked_mc_btc_nav_chart(processed_data['df'], company_name, config, output_dir)
+        return create_stacked_mc_btc_nav_chart(processed_data['df'], company_name, config, output_dir)
     return stacked_area_chart
 
 
@@ -1076,8 +1332,9 @@ def create_btc_per_share_generator(custom_colors=None, show_annotations=True, sh
             config['btc_per_share_labels'] = btc_per_share_labels
         if not show_annotations:
             config['show_annotations'] = False
+        config['subtitle_date'] = processed_data.get('subtitle_date')
         # Add any additional kwargs to config
         config.update(kwargs)
         
-        create_btc_per_share_chart(processed_data['df'], company_name, config, output_dir)
+        return create_btc_per_share_chart(processed_data['df'], company_name, config, output_dir)
     return btc_per_share_chart
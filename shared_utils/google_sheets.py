@@ -7,6 +7,7 @@ using direct HTTP requests instead of the heavy Google API client libraries.
 
 Environment Variables:
     GOOGLE_API_KEY: Google API key with Sheets API access enabled
+    GOOGLE_SHEETS_CACHE_TTL: Seconds to reuse a cached sheet without refetching it (optional, defaults to 0)
 
 Setup:
     1. Go to Google Cloud Console
@@ -17,18 +18,23 @@ Setup:
 
 Dependencies:
     Only requires: requests, pandas (already in main requirements.txt)
+    Uses orjson for faster JSON decoding when it is installed
 """
 
+import hashlib
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List
 from urllib.parse import quote
 
 import pandas as pd
 import requests
 
+from .http_cache import _json_loads, fetch_with_etag
+
 
 def convert_google_sheets_date(serial_number):
     """
@@ -88,17 +94,31 @@ def get_sheet_data(spreadsheet_id: str, range_name: str = 'Sheet1') -> List[List
         'valueRenderOption': 'UNFORMATTED_VALUE'
     }
     
+    # One disk cache entry per sheet range; revalidated with ETag when the API sends one,
+    # and reused outright for GOOGLE_SHEETS_CACHE_TTL seconds
+    cache_key = hashlib.sha256(f"{spreadsheet_id}/{range_name}".encode('utf-8')).hexdigest()[:16]
+    cache_ttl_setting = os.getenv('GOOGLE_SHEETS_CACHE_TTL', '0')
+    try:
+        cache_ttl = max(int(cache_ttl_setting), 0)
+    except ValueError:
+        # A typo in an optional tuning knob should not stop the load; just always revalidate
+        logging.warning(f"Ignoring invalid GOOGLE_SHEETS_CACHE_TTL={cache_ttl_setting!r}, expected seconds")
+        cache_ttl = 0
+    
     try:
-        response = requests.get(url, params=params, timeout=4)
-        response.raise_for_status()
+        # Shared pooled session: loading several company sheets reuses one TLS connection
+        content = fetch_with_etag(url, cache_name=f"sheet_{cache_key}", timeout=4,
+                                  params=params, max_age=cache_ttl)
         
-        data = response.json()
+        # orjson's decode errors subclass json.JSONDecodeError, so the handler below covers both
+        data = _json_loads(content)
         values = data.get('values', [])
         
         logging.info(f"Retrieved {len(values)} rows from Google Sheet {spreadsheet_id}")
         return values
         
     except requests.exceptions.HTTPError as e:
+        response = e.response
         if response.status_code == 403:
             raise Exception(
                 f"Access denied to spreadsheet {spreadsheet_id}. "
@@ -149,12 +169,13 @@ def sheet_to_dataframe(spreadsheet_id: str, range_name: str = 'Sheet1',
             headers = [f'Column_{i+1}' for i in range(max_cols)]
             data_rows = values
         
-        # Pad rows to match header length
+        # Pad rows to match header length; the API trims trailing empty cells, so only
+        # short or overlong rows need a new list and full rows are passed through as-is
         max_cols = len(headers)
-        padded_rows = []
-        for row in data_rows:
-            padded_row = row + [''] * (max_cols - len(row))
-            padded_rows.append(padded_row[:max_cols])  # Truncate if too long
+        padded_rows = [
+            row if len(row) == max_cols else (row + [''] * (max_cols - len(row)))[:max_cols]
+            for row in data_rows
+        ]
         
         df = pd.DataFrame(padded_rows, columns=headers)
         
@@ -215,28 +236,18 @@ def load_bitcoin_data_from_sheet(spreadsheet_id: str, range_name: str = 'Sheet1'
             )
         
         # Convert data types
-        df[date_column] = pd.to_numeric(df[date_column], errors='coerce').apply(convert_google_sheets_date)
-        df[btc_balance_column] = pd.to_numeric(df[btc_balance_column], errors='coerce')
-        df[shares_column] = pd.to_numeric(df[shares_column], errors='coerce')
-        df[stock_price_column] = pd.to_numeric(df[stock_price_column], errors='coerce')
+        # Same mapping as convert_google_sheets_date, vectorized: serials count days from
+        # 1899-12-30 and non-positive or non-numeric values become NaT
+        serial = pd.to_numeric(df[date_column], errors='coerce')
+        df[date_column] = pd.to_datetime(serial.where(serial > 0), unit='D', origin='1899-12-30')
         
-        # Convert btc_per_share column if provided
-        if btc_per_share_column is not None:
-            df[btc_per_share_column] = pd.to_numeric(df[btc_per_share_column], errors='coerce')
-        
-        # Convert btc_price column if provided
-        if btc_price_column is not None:
-            df[btc_price_column] = pd.to_numeric(df[btc_price_column], errors='coerce')
+        # Numeric columns (including the optional btc_per_share/btc_price ones) in one assignment
+        numeric_columns = required_columns[1:]
+        df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce')
         
         # Remove rows with invalid data
         initial_count = len(df)
-        required_numeric_columns = [date_column, btc_balance_column, shares_column, stock_price_column]
-        if btc_per_share_column is not None:
-            required_numeric_columns.append(btc_per_share_column)
-        if btc_price_column is not None:
-            required_numeric_columns.append(btc_price_column)
-            
-        df = df.dropna(subset=required_numeric_columns)
+        df = df.dropna(subset=required_columns)
         final_count = len(df)
         
         if final_count < initial_count:
@@ -266,7 +277,7 @@ def load_bitcoin_data_from_sheet(spreadsheet_id: str, range_name: str = 'Sheet1'
         # Calculate derived columns needed for analysis
         if btc_per_share_column is None:
             # Calculate if not provided
-            df['btc_per_diluted_share'] = df['btc_balance'] / df['diluted_shares_outstanding']
+            df['btc_per_diluted_share'] = df['btc_balance'].to_numpy() / df['diluted_shares_outstanding'].to_numpy()
         # If btc_per_share_column was provided, it's already renamed to 'btc_per_diluted_share' above
         
         logging.info(f"Successfully loaded {len(df)} records from Google Sheets")
@@ -276,3 +287,27 @@ def load_bitcoin_data_from_sheet(spreadsheet_id: str, range_name: str = 'Sheet1'
         
     except Exception as e:
         raise Exception(f"Error loading bitcoin data from Google Sheets: {e}")
+
+
+def load_bitcoin_data_from_sheets(specs: List[Dict], max_workers: int = 8) -> List[pd.DataFrame]:
+    """
+    Load several sheets concurrently with load_bitcoin_data_from_sheet.
+    
+    The requests are network-bound and release the GIL while waiting, so
+    threads overlap the round trips over the shared pooled session.
+    
+    Args:
+        specs (List[Dict]): Keyword arguments for load_bitcoin_data_from_sheet, one dict per sheet
+        max_workers (int): Maximum number of concurrent requests
+        
+    Returns:
+        List[pd.DataFrame]: DataFrames in the same order as specs
+        
+    Raises:
+        Exception: The first failure among the sheet loads
+    """
+    if not specs:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+        return list(executor.map(lambda spec: load_bitcoin_data_from_sheet(**spec), specs))
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Conditional-GET disk cache for remote data files
+================================================
+Keeps the last response body for a URL on disk together with its ETag /
+Last-Modified validators. Repeated runs send If-None-Match / If-Modified-Since
+and reuse the cached body on a 304, so unchanged payloads are not downloaded again.
+Callers may also pass max_age to reuse a recent copy without any request at all.
+
+Environment Variables:
+- BTCTCS_CACHE_DIR: Cache directory (optional, defaults to ~/.cache/btctcs)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up for the JSON payloads; stdlib json is used without it
+    orjson = None
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_cache_dir():
+    """Return the cache directory, honouring BTCTCS_CACHE_DIR"""
+    return os.getenv('BTCTCS_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'btctcs'))
+
+
+def get_session():
+    """Shared requests.Session, so fetches for several trackers reuse pooled keep-alive connections"""
+    global _session
+    # Sheets may be loaded from several threads at once; create the session only once
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+    return _session
+
+
+def _json_loads(content):
+    """Parse a JSON body with orjson when available (its errors subclass json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _write_atomic(path, content):
+    """Write bytes to path via a temp file so readers never see a partial file"""
+    # A uniquely named temp file per writer, so concurrent fetches of the same entry
+    # never write into or replace each other's temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.",
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def fetch_with_etag(url, cache_name, timeout=30, params=None, max_age=0):
+    """
+    GET a URL, revalidating a locally cached copy instead of re-downloading it
+
+    Args:
+        url (str): URL to fetch
+        cache_name (str): Name of the cache entry (one per data source)
+        timeout (int): Request timeout in seconds
+        params (dict, optional): Query parameters, part of the cache key like the URL
+        max_age (int): Seconds a cached copy is reused without contacting the server (0 = always revalidate)
+
+    Returns:
+        bytes: Response body, read from the cache when the server answers 304
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    cache_dir = get_cache_dir()
+    body_path = os.path.join(cache_dir, f"{cache_name}.body")
+    meta_path = os.path.join(cache_dir, f"{cache_name}.meta.json")
+    # Only the URL hash is stored, data URLs and query parameters may embed access tokens
+    full_url = requests.Request('GET', url, params=params).prepare().url
+    url_hash = hashlib.sha256(full_url.encode('utf-8')).hexdigest()
+
+    headers = {}
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        if meta.get('url_sha256') == url_hash and os.path.exists(body_path):
+            age = time.time() - meta.get('fetched_at', 0)
+            if age < max_age:
+                with open(body_path, 'rb') as f:
+                    content = f.read()
+                logging.info(f"Using cached copy of {cache_name} ({age:.0f}s old)")
+                return content
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+    except (OSError, ValueError):
+        pass
+
+    session = get_session()
+    response = session.get(url, params=params, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and headers:
+        try:
+            with open(body_path, 'rb') as f:
+                content = f.read()
+            logging.info(f"Not modified, using cached copy of {cache_name}")
+            if max_age:
+                # Restart the max_age window; the server just confirmed the copy
+                meta['fetched_at'] = time.time()
+                try:
+                    _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+                except OSError:
+                    pass
+            return content
+        except OSError:
+            # Cache vanished between the check and the read; fetch unconditionally
+            response = session.get(url, params=params, timeout=timeout)
+
+    response.raise_for_status()
+    content = response.content
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified or max_age:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            _write_atomic(body_path, content)
+            meta = {'url_sha256': url_hash, 'etag': etag, 'last_modified': last_modified,
+                    'fetched_at': time.time()}
+            _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as e:
+            # Caching is best effort; never fail the load because of it
+            logging.warning(f"Could not write cache for {cache_name}: {e}")
+
+    return content
@@ -11,17 +11,322 @@ Environment Variables:
 - AWS_REGION: AWS region (optional, defaults to us-east-1)
 - AWS_ENDPOINT_URL: Custom S3 endpoint URL (optional, for S3-compatible services)
 - S3_KEY_PREFIX: S3 key prefix (optional, defaults to 'charts')
+- S3_UPLOAD_CONCURRENCY: Number of files uploaded in parallel (optional, defaults to 8)
+- S3_MULTIPART_THRESHOLD: File size in bytes above which multipart upload is used (optional, defaults to 8 MiB)
+- S3_MULTIPART_CHUNKSIZE: Multipart part size in bytes (optional, defaults to 16 MiB)
+- S3_MAX_CONCURRENCY: Parallel parts per multipart upload (optional, defaults to 10)
+- S3_MAX_ATTEMPTS: Attempts per request, including the first, in adaptive retry mode (optional, defaults to 5)
+- S3_COMPANY_CONCURRENCY: Number of companies uploaded in parallel by upload_multiple_companies (optional, defaults to 4)
+- S3_SKIP_UNCHANGED: Skip files whose S3 ETag matches the local MD5 (optional, defaults to 1; set 0 to always upload)
+- S3_OPTIMIZE_PNG: Recompress PNGs at the highest zlib level before uploading (optional, defaults to 0)
+- S3_FORCE_REUPLOAD: Ignore the local .upload_manifest.json and upload every file (optional, defaults to 0)
+- S3_LEGACY_ACL: Set 1 to mark every object public-read via its ACL (optional, defaults to 0). By default
+  objects get no ACL and public access comes from a bucket policy, which also works with Object
+  Ownership "Bucket owner enforced" where ACLs are rejected, e.g.
+  {"Version": "2012-10-17", "Statement": [{"Effect": "Allow", "Principal": "*", "Action": "s3:GetObject",
+   "Resource": "arn:aws:s3:::<bucket>/charts/*"}]}
+- CF_DIST_ID: CloudFront distribution in front of the bucket (optional). When set, the CDN caches charts
+  for a year and only the keys that actually changed are invalidated after each upload
 """
 
-import glob
+import functools
+import hashlib
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# Browsers always revalidate after 5 minutes; with CF_DIST_ID the CDN keeps objects until invalidated.
+# Chart filenames are stable, so 'immutable' would pin stale charts in browser caches.
+DEFAULT_CACHE_CONTROL = 'max-age=300'
+CDN_CACHE_CONTROL = 'public, max-age=300, s-maxage=31536000'
 
-def upload_company_charts(company_directory, company_name=None):
+# Per company directory record of what was last uploaded, so unchanged files are skipped without any request
+MANIFEST_FILENAME = '.upload_manifest.json'
+
+
+# lru_cache does not serialize a first call made from several threads at once, and
+# boto3's default session is not thread-safe, so client creation goes through this lock
+_s3_client_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_s3_client(aws_access_key_id, aws_secret_access_key, aws_region, aws_endpoint_url, max_pool_connections,
+                   max_attempts=5):
+    """
+    Create the S3 client once per configuration and reuse it across companies
+    
+    Keeping one client keeps its pooled HTTPS connections alive between
+    upload_company_charts calls instead of re-doing the handshakes.
+    """
+    s3_client = boto3.client(
+        's3',
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region_name=aws_region,
+        endpoint_url=aws_endpoint_url,
+        config=Config(
+            # One pooled connection per upload thread, so parallel PUTs don't wait on the pool
+            max_pool_connections=max_pool_connections,
+            # Adaptive mode backs off with jitter and rate-limits the client on throttling
+            # responses, instead of the legacy mode's immediate retry bursts
+            retries={'mode': 'adaptive', 'total_max_attempts': max_attempts},
+            connect_timeout=5,
+            read_timeout=60,
+            # Keep idle pooled connections alive between one company's burst of uploads and the next
+            tcp_keepalive=True
+        )
+    )
+    if aws_endpoint_url:
+        print(f"Successfully initialized S3 client for region: {aws_region} using custom endpoint: {aws_endpoint_url}")
+    else:
+        print(f"Successfully initialized S3 client for region: {aws_region}")
+    return s3_client
+
+
+def _s3_client_from_env():
+    """The shared S3 client for the AWS_* and S3_* environment settings"""
+    # The client may serve several companies' upload threads at once (upload_multiple_companies),
+    # so size its pool for both levels. A multipart upload (files above S3_MULTIPART_THRESHOLD)
+    # also sends S3_MAX_CONCURRENCY parts at once.
+    max_workers = int(os.getenv('S3_UPLOAD_CONCURRENCY', '8'))
+    company_workers = int(os.getenv('S3_COMPANY_CONCURRENCY', '4'))
+    max_concurrency = int(os.getenv('S3_MAX_CONCURRENCY', '10'))
+    pool_size = max(max_workers * company_workers, max_concurrency, 10)
+    with _s3_client_lock:
+        try:
+            return _get_s3_client(os.getenv('AWS_ACCESS_KEY_ID'), os.getenv('AWS_SECRET_ACCESS_KEY'),
+                                  os.getenv('AWS_REGION', 'us-east-1'), os.getenv('AWS_ENDPOINT_URL'),
+                                  pool_size, int(os.getenv('S3_MAX_ATTEMPTS', '5')))
+        except NoCredentialsError:
+            raise ValueError("Invalid AWS credentials provided")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cloudfront_client(aws_access_key_id, aws_secret_access_key):
+    """Create the CloudFront client once and reuse it across companies"""
+    return boto3.client(
+        'cloudfront',
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key
+    )
+
+
+def _invalidate_cdn(cloudfront_client, distribution_id, s3_keys, caller_reference):
+    """
+    Invalidate the changed keys in one CloudFront request
+    
+    Returns:
+        bool: False if the request failed (reported, not raised), True otherwise
+    """
+    if not s3_keys:
+        return True
+    paths = ['/' + s3_key for s3_key in s3_keys]
+    try:
+        response = cloudfront_client.create_invalidation(
+            DistributionId=distribution_id,
+            InvalidationBatch={
+                'Paths': {'Quantity': len(paths), 'Items': paths},
+                'CallerReference': caller_reference
+            }
+        )
+        print(f"🔄 CloudFront invalidation {response['Invalidation']['Id']} created for {len(paths)} files")
+        return True
+    except ClientError as e:
+        print(f"⚠️  CloudFront invalidation failed, retrying it on the next upload: {e}")
+        return False
+
+
+def _is_png_entry(entry):
+    """True for a regular, non-hidden *.png directory entry (what glob('*.png') matches)"""
+    return entry.name.endswith('.png') and not entry.name.startswith('.') and entry.is_file()
+
+
+def _optimize_png(png_file):
+    """
+    Losslessly recompress a PNG in place with Pillow at the highest zlib level
+    
+    Returns:
+        tuple: (size before, size after) in bytes
+    """
+    from PIL import Image  # Pillow ships with matplotlib; only needed when S3_OPTIMIZE_PNG is set
+    
+    size_before = os.path.getsize(png_file)
+    with Image.open(png_file) as image:
+        image.load()
+    tmp_path = f"{png_file}.tmp"
+    image.save(tmp_path, format='PNG', optimize=True, compress_level=9)
+    if os.path.getsize(tmp_path) < size_before:
+        os.replace(tmp_path, png_file)
+    else:
+        os.remove(tmp_path)
+    return size_before, os.path.getsize(png_file)
+
+
+def _file_md5(path):
+    """Hex MD5 of a file, comparable to the ETag of a single-part S3 upload"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'md5').hexdigest()
+        
+        # Older Pythons: hash through one reusable 1 MiB buffer instead of reading the whole file
+        digest = hashlib.md5()
+        buffer = bytearray(1024 * 1024)
+        view = memoryview(buffer)
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(view[:n])
+        return digest.hexdigest()
+
+
+def _is_unchanged_in_s3(s3_client, png_file, bucket_name, s3_key):
+    """True if the object at s3_key already holds exactly this file's bytes"""
+    try:
+        response = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+    except ClientError:
+        # Missing object (404) or no read permission; upload as usual
+        return False
+    # Multipart ETags contain a '-' and never equal a plain MD5, so those are re-uploaded
+    return response.get('ETag', '').strip('"') == _file_md5(png_file)
+
+
+def _file_signature(path):
+    """[mtime_ns, size] of a file, as stored in the upload manifest"""
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_manifest(company_directory, destination):
+    """
+    The previous run's record for destination ({} if none or unreadable)
+    
+    'files' maps filename to the signature it was uploaded with, 'pending_invalidation'
+    lists S3 keys whose CloudFront invalidation failed
+    """
+    try:
+        with open(os.path.join(company_directory, MANIFEST_FILENAME), 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # A different bucket or prefix holds none of these files yet
+    if not isinstance(manifest, dict) or manifest.get('destination') != destination:
+        return {}
+    return manifest
+
+
+def _save_manifest(company_directory, destination, files, pending_invalidation=()):
+    """Write the manifest via a temp file so an interrupted run never leaves it half written"""
+    manifest_path = os.path.join(company_directory, MANIFEST_FILENAME)
+    tmp_path = f"{manifest_path}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({'destination': destination, 'files': files,
+                       'pending_invalidation': sorted(pending_invalidation)}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        # The manifest only saves requests; never fail the upload because of it
+        print(f"⚠️  Could not write upload manifest: {e}")
+
+
+def _upload_one(s3_client, png_file, bucket_name, s3_key_prefix, company_name, aws_region, timestamp,
+                transfer_config=None, skip_unchanged=False, optimize_png=False, manifest=None,
+                cache_control=DEFAULT_CACHE_CONTROL, legacy_acl=False):
+    """
+    Upload a single PNG file to S3
+    
+    Returns:
+        tuple: (True, uploaded file info) on success or when skipped as unchanged,
+               (False, failed file info) on error
+    """
+    # Get the filename without path
+    filename = os.path.basename(png_file)
+    
+    # Create S3 key with timestamp and company organization
+    s3_key = f"{s3_key_prefix}/{company_name.lower()}/{filename}"
+    
+    # Generate S3 URL
+    s3_url = f"https://{bucket_name}.s3.{aws_region}.amazonaws.com/{s3_key}"
+    
+    try:
+        # Same mtime and size as at the last successful upload; nothing to send or even check
+        if manifest and manifest.get(filename) == _file_signature(png_file):
+            print(f"⏭️  Unchanged since last upload, skipped: {filename}")
+            return True, {
+                'local_file': png_file,
+                'filename': filename,
+                's3_key': s3_key,
+                's3_url': s3_url,
+                'skipped': True
+            }
+        
+        # Shrink the file before it is hashed and sent; fewer bytes on the wire
+        if optimize_png:
+            size_before, size_after = _optimize_png(png_file)
+            print(f"Optimized {filename}: {size_before:,} → {size_after:,} bytes")
+        
+        # Re-running the analysis often reproduces identical PNGs; don't PUT those again
+        if skip_unchanged and _is_unchanged_in_s3(s3_client, png_file, bucket_name, s3_key):
+            print(f"⏭️  Unchanged, skipped upload: {filename}")
+            return True, {
+                'local_file': png_file,
+                'filename': filename,
+                's3_key': s3_key,
+                's3_url': s3_url,
+                'skipped': True
+            }
+        
+        # Upload file to S3; one line per file, the summary repeats the destination URLs
+        extra_args = {
+            'ContentType': 'image/png',
+            'CacheControl': cache_control,
+            'Metadata': {
+                'company': company_name,
+                'upload_date': timestamp,
+                'source': 'bitcoin_treasury_analysis'
+            }
+        }
+        if legacy_acl:
+            extra_args['ACL'] = 'public-read'  # Buckets without a public-read policy
+        multipart_threshold = transfer_config.multipart_threshold if transfer_config else 8 * 1024 * 1024
+        if os.path.getsize(png_file) < multipart_threshold:
+            # Single-part anyway; a direct PUT skips the transfer manager's thread handoff per file
+            with open(png_file, 'rb') as body:
+                s3_client.put_object(Bucket=bucket_name, Key=s3_key, Body=body, **extra_args)
+        else:
+            s3_client.upload_file(png_file, bucket_name, s3_key, ExtraArgs=extra_args, Config=transfer_config)
+        
+        print(f"✅ Successfully uploaded: {filename}")
+        return True, {
+            'local_file': png_file,
+            'filename': filename,
+            's3_key': s3_key,
+            's3_url': s3_url
+        }
+        
+    except ClientError as e:
+        error_msg = f"Failed to upload {filename}: {e}"
+        error = str(e)
+    except Exception as e:
+        error_msg = f"Unexpected error uploading {filename}: {e}"
+        error = str(e)
+    
+    print(f"❌ {error_msg}")
+    return False, {
+        'local_file': png_file,
+        'filename': filename,
+        'error': error
+    }
+
+
+def upload_company_charts(company_directory, company_name=None, s3_client=None):
     """
     Upload all PNG files from a company directory to S3
     
@@ -29,6 +334,8 @@ def upload_company_charts(company_directory, company_name=None):
         company_directory (str): Path to the company directory containing PNG files
         company_name (str): Optional company name for S3 key prefix. 
                            If None, uses directory name
+        s3_client: Optional boto3 S3 client to use. If None, a client built from
+                   the environment is created once and reused across calls
     
     Returns:
         dict: Upload results with success/failure counts and file details
@@ -38,8 +345,22 @@ def upload_company_charts(company_directory, company_name=None):
     aws_access_key_id = os.getenv('AWS_ACCESS_KEY_ID')
     aws_secret_access_key = os.getenv('AWS_SECRET_ACCESS_KEY')
     aws_region = os.getenv('AWS_REGION', 'us-east-1')  # Default to us-east-1
-    aws_endpoint_url = os.getenv('AWS_ENDPOINT_URL')  # Custom endpoint URL (optional)
     s3_key_prefix = os.getenv('S3_KEY_PREFIX', 'charts')  # Default prefix
+    max_workers = int(os.getenv('S3_UPLOAD_CONCURRENCY', '8'))
+    skip_unchanged = os.getenv('S3_SKIP_UNCHANGED', '1') == '1'
+    optimize_png = os.getenv('S3_OPTIMIZE_PNG', '0') == '1'
+    force_reupload = os.getenv('S3_FORCE_REUPLOAD', '0') == '1'
+    cf_distribution_id = os.getenv('CF_DIST_ID')
+    legacy_acl = os.getenv('S3_LEGACY_ACL', '0') == '1'
+    cache_control = CDN_CACHE_CONTROL if cf_distribution_id else DEFAULT_CACHE_CONTROL
+    
+    # Transfer manager settings, built once and shared by every upload_file call
+    transfer_config = TransferConfig(
+        multipart_threshold=int(os.getenv('S3_MULTIPART_THRESHOLD', str(8 * 1024 * 1024))),
+        multipart_chunksize=int(os.getenv('S3_MULTIPART_CHUNKSIZE', str(16 * 1024 * 1024))),
+        max_concurrency=int(os.getenv('S3_MAX_CONCURRENCY', '10')),
+        use_threads=True
+    )
     
     # Validate required environment variables
     if not bucket_name:
@@ -57,25 +378,14 @@ def upload_company_charts(company_directory, company_name=None):
     print(f"Source directory: {company_directory}")
     print(f"S3 key prefix: {s3_key_prefix}/{company_name}")
     
-    # Initialize S3 client
-    try:
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=aws_region,
-            endpoint_url=aws_endpoint_url
-        )
-        if aws_endpoint_url:
-            print(f"Successfully initialized S3 client for region: {aws_region} using custom endpoint: {aws_endpoint_url}")
-        else:
-            print(f"Successfully initialized S3 client for region: {aws_region}")
-    except NoCredentialsError:
-        raise ValueError("Invalid AWS credentials provided")
+    # Initialize S3 client, shared with other calls using the same settings
+    if s3_client is None:
+        s3_client = _s3_client_from_env()
     
-    # Find all PNG files in the company directory
-    png_pattern = os.path.join(company_directory, "*.png")
-    png_files = glob.glob(png_pattern)
+    # Find all PNG files in the company directory; scandir entries carry their file type,
+    # so no extra stat per file
+    with os.scandir(company_directory) as entries:
+        png_files = [entry.path for entry in entries if _is_png_entry(entry)]
     
     if not png_files:
         print(f"No PNG files found in directory: {company_directory}")
@@ -95,62 +405,48 @@ def upload_company_charts(company_directory, company_name=None):
     # Get current timestamp for file organization
     timestamp = datetime.now().strftime('%Y-%m-%d')
     
-    # Upload each PNG file
-    for png_file in png_files:
-        try:
-            # Get the filename without path
-            filename = os.path.basename(png_file)
-            
-            # Create S3 key with timestamp and company organization
-            s3_key = f"{s3_key_prefix}/{company_name.lower()}/{filename}"
-            
-            # Upload file to S3
-            print(f"Uploading {filename} to s3://{bucket_name}/{s3_key}")
-            
-            s3_client.upload_file(
-                png_file,
-                bucket_name,
-                s3_key,
-                ExtraArgs={
-                    'ContentType': 'image/png',
-                    'ACL': 'public-read',  # Make file publicly accessible
-                    'CacheControl': 'max-age=300',  # Cache for 5 minutes (300 seconds)
-                    'Metadata': {
-                        'company': company_name,
-                        'upload_date': timestamp,
-                        'source': 'bitcoin_treasury_analysis'
-                    }
-                }
-            )
-            
-            # Generate S3 URL
-            s3_url = f"https://{bucket_name}.s3.{aws_region}.amazonaws.com/{s3_key}"
-            
-            uploaded_files.append({
-                'local_file': png_file,
-                'filename': filename,
-                's3_key': s3_key,
-                's3_url': s3_url
-            })
-            
-            print(f"✅ Successfully uploaded: {filename}")
-            
-        except ClientError as e:
-            error_msg = f"Failed to upload {filename}: {e}"
-            print(f"❌ {error_msg}")
-            failed_files.append({
-                'local_file': png_file,
-                'filename': filename,
-                'error': str(e)
-            })
-        except Exception as e:
-            error_msg = f"Unexpected error uploading {filename}: {e}"
-            print(f"❌ {error_msg}")
-            failed_files.append({
-                'local_file': png_file,
-                'filename': filename,
-                'error': str(e)
-            })
+    # Files uploaded here by an earlier run, keyed by filename, and CDN invalidations still owed
+    destination = f"s3://{bucket_name}/{s3_key_prefix}/{company_name.lower()}"
+    previous_run = _load_manifest(company_directory, destination)
+    manifest = {} if force_reupload else previous_run.get('files', {})
+    pending_invalidation = previous_run.get('pending_invalidation', [])
+    
+    # Upload the PNG files in parallel; PUTs are latency-bound and the client is thread-safe
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(png_files)))) as executor:
+        results = list(executor.map(
+            lambda png_file: _upload_one(s3_client, png_file, bucket_name, s3_key_prefix,
+                                         company_name, aws_region, timestamp, transfer_config,
+                                         skip_unchanged, optimize_png, manifest, cache_control,
+                                         legacy_acl),
+            png_files
+        ))
+    
+    uploaded_manifest = {}
+    for succeeded, file_info in results:
+        if succeeded:
+            uploaded_files.append(file_info)
+            # Stat after the upload, so an S3_OPTIMIZE_PNG rewrite is what gets recorded
+            try:
+                uploaded_manifest[file_info['filename']] = _file_signature(file_info['local_file'])
+            except OSError:
+                pass
+        else:
+            failed_files.append(file_info)
+    
+    # Only keys that were actually re-uploaded need to leave the CDN cache, plus any whose
+    # invalidation failed last time. Skips by manifest or ETag would never resend those, so
+    # a failed invalidation is recorded in the manifest until one succeeds.
+    if cf_distribution_id:
+        changed_keys = set(pending_invalidation)
+        changed_keys.update(file_info['s3_key'] for file_info in uploaded_files if not file_info.get('skipped'))
+        if _invalidate_cdn(_get_cloudfront_client(aws_access_key_id, aws_secret_access_key),
+                           cf_distribution_id, sorted(changed_keys), f"{destination}@{datetime.now().isoformat()}"):
+            pending_invalidation = []
+        else:
+            pending_invalidation = sorted(changed_keys)
+    
+    # Failed files are left out so the next run retries them
+    _save_manifest(company_directory, destination, uploaded_manifest, pending_invalidation)
     
     # Print summary
     success_count = len(uploaded_files)
@@ -159,6 +455,9 @@ def upload_company_charts(company_directory, company_name=None):
     print(f"\n📊 Upload Summary for {company_name}:")
     print(f"✅ Successfully uploaded: {success_count} files")
     print(f"❌ Failed uploads: {failure_count} files")
+    skipped_count = sum(1 for file_info in uploaded_files if file_info.get('skipped'))
+    if skipped_count:
+        print(f"⏭️  Unchanged, not re-uploaded: {skipped_count} of those files")
     
     if uploaded_files:
         print(f"\n📁 Uploaded files:")
@@ -195,42 +494,58 @@ def upload_multiple_companies(base_directory, company_names=None):
     if company_names is None:
         # Find all subdirectories that contain PNG files
         company_names = []
-        for item in os.listdir(base_directory):
-            company_dir = os.path.join(base_directory, item)
-            if os.path.isdir(company_dir):
-                png_files = glob.glob(os.path.join(company_dir, "*.png"))
-                if png_files:
-                    company_names.append(item)
+        with os.scandir(base_directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as company_entries:
+                        if any(_is_png_entry(company_entry) for company_entry in company_entries):
+                            company_names.append(entry.name)
     
     print(f"Uploading charts for companies: {company_names}")
     
+    # Create the client once, before any worker thread needs it; missing credentials
+    # are reported for each company by upload_company_charts
+    s3_client = None
+    if os.getenv('AWS_ACCESS_KEY_ID') and os.getenv('AWS_SECRET_ACCESS_KEY'):
+        s3_client = _s3_client_from_env()
+    
+    def upload_one_company(company_name):
+        company_dir = os.path.join(base_directory, company_name)
+        if not os.path.isdir(company_dir):
+            print(f"⚠️  Directory not found: {company_dir}")
+            return None
+        
+        print(f"\n{'='*60}")
+        print(f"Processing {company_name}")
+        print(f"{'='*60}")
+        
+        try:
+            return upload_company_charts(company_dir, company_name, s3_client=s3_client)
+        except Exception as e:
+            print(f"❌ Failed to process {company_name}: {e}")
+            return {
+                'success_count': 0,
+                'failure_count': 0,
+                'uploaded_files': [],
+                'failed_files': [],
+                'error': str(e)
+            }
+    
+    # Companies are independent and I/O-bound; upload several at once over the shared client
+    max_workers = int(os.getenv('S3_COMPANY_CONCURRENCY', '4'))
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(company_names)))) as executor:
+        results = list(executor.map(upload_one_company, company_names))
+    
     all_results = {}
     total_success = 0
     total_failure = 0
     
-    for company_name in company_names:
-        company_dir = os.path.join(base_directory, company_name)
-        if os.path.isdir(company_dir):
-            print(f"\n{'='*60}")
-            print(f"Processing {company_name}")
-            print(f"{'='*60}")
-            
-            try:
-                result = upload_company_charts(company_dir, company_name)
-                all_results[company_name] = result
-                total_success += result['success_count']
-                total_failure += result['failure_count']
-            except Exception as e:
-                print(f"❌ Failed to process {company_name}: {e}")
-                all_results[company_name] = {
-                    'success_count': 0,
-                    'failure_count': 0,
-                    'uploaded_files': [],
-                    'failed_files': [],
-                    'error': str(e)
-                }
-        else:
-            print(f"⚠️  Directory not found: {company_dir}")
+    for company_name, result in zip(company_names, results):
+        if result is None:
+            continue
+        all_results[company_name] = result
+        total_success += result['success_count']
+        total_failure += result['failure_count']
     
     print(f"\n🎯 Overall Summary:")
     print(f"✅ Total successful uploads: {total_success}")
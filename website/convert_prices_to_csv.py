@@ -8,6 +8,11 @@ import csv
 from datetime import datetime
 import os
 
+try:
+    import orjson
+except ImportError:  # Standalone script; falls back to stdlib json without orjson
+    orjson = None
+
 def convert_prices_to_csv(json_file_path, csv_file_path):
     """
     Convert prices JSON to CSV with human-readable dates
@@ -20,8 +25,9 @@ def convert_prices_to_csv(json_file_path, csv_file_path):
     
     # Read the JSON file
     print(f"Reading JSON file: {json_file_path}")
-    with open(json_file_path, 'r') as f:
-        data = json.load(f)
+    with open(json_file_path, 'rb') as f:
+        content = f.read()
+    data = orjson.loads(content) if orjson is not None else json.loads(content)
     
     # Extract prices array
     prices = data.get('prices', [])
@@ -36,71 +42,77 @@ def convert_prices_to_csv(json_file_path, csv_file_path):
     currency_columns = [key for key in sample_record.keys() if key != 'time']
     print(f"Currency columns found: {currency_columns}")
     
-    # Filter for only 12:00:00 prices
-    daily_prices = []
-    seen_dates = set()
-    
-    print("Filtering for daily 12:00:00 prices...")
-    for record in prices:
-        timestamp = record['time']
-        
-        try:
-            dt = datetime.fromtimestamp(timestamp)
-            
-            # Check if this is a 12:00:00 time
-            if dt.hour == 12 and dt.minute == 0 and dt.second == 0:
-                date_str = dt.strftime('%Y-%m-%d')
-                
-                # Only keep one 12:00:00 price per day (in case of duplicates)
-                if date_str not in seen_dates:
-                    daily_prices.append(record)
-                    seen_dates.add(date_str)
-                    
-        except (ValueError, OSError) as e:
-            print(f"Warning: Could not convert timestamp {timestamp}: {e}")
-            continue
-    
-    print(f"Filtered to {len(daily_prices)} daily records (12:00:00 only)")
-    
-    if not daily_prices:
-        print("No 12:00:00 price records found")
-        return
-    
     # Prepare CSV headers
     csv_headers = ['date', 'datetime', 'timestamp'] + currency_columns
     
-    # Write to CSV
-    print(f"Writing CSV file: {csv_file_path}")
-    with open(csv_file_path, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        
-        # Write headers
-        writer.writerow(csv_headers)
-        
-        # Write data rows
-        for record in daily_prices:
+    # Filter for only 12:00:00 prices and write each one as soon as it is found,
+    # so matching records are converted once and never collected in a list
+    seen_dates = set()
+    csvfile = None
+    writer = None
+    # Rows go to a temp file that replaces the CSV only once the loop has finished,
+    # so a failure part way never leaves a truncated CSV in place of the previous one
+    tmp_path = f"{csv_file_path}.tmp"
+    
+    # Every UTC offset in use is a whole multiple of 15 minutes, so a local 12:00:00 is
+    # always on a 900-second boundary in epoch time. The zone's current offsets are not
+    # enough (zones like Europe/Moscow changed theirs), so only this integer test is used
+    # to reject records before datetime.fromtimestamp confirms the match
+    
+    print("Filtering for daily 12:00:00 prices...")
+    try:
+        for record in prices:
             timestamp = record['time']
             
-            # Convert Unix timestamp to human-readable date
+            if timestamp % 900:
+                continue
+            
             try:
                 dt = datetime.fromtimestamp(timestamp)
-                date_only = dt.strftime('%Y-%m-%d')
-                human_date = dt.strftime('%Y-%m-%d %H:%M:%S')
             except (ValueError, OSError) as e:
                 print(f"Warning: Could not convert timestamp {timestamp}: {e}")
-                date_only = f"INVALID_DATE_{timestamp}"
-                human_date = f"INVALID_TIMESTAMP_{timestamp}"
+                continue
+            
+            # Check if this is a 12:00:00 time
+            if not (dt.hour == 12 and dt.minute == 0 and dt.second == 0):
+                continue
             
-            # Build row data
-            row = [date_only, human_date, timestamp]
+            date_only = dt.strftime('%Y-%m-%d')
             
-            # Add currency values
-            for currency in currency_columns:
-                row.append(record.get(currency, ''))
+            # Only keep one 12:00:00 price per day (in case of duplicates)
+            if date_only in seen_dates:
+                continue
+            seen_dates.add(date_only)
+            
+            # Open the CSV on the first match, so no file is written when nothing matches
+            if writer is None:
+                print(f"Writing CSV file: {csv_file_path}")
+                csvfile = open(tmp_path, 'w', newline='', buffering=1024 * 1024)
+                writer = csv.writer(csvfile)
+                writer.writerow(csv_headers)
+            
+            # Build row data with the human-readable date and the currency values
+            row = [date_only, dt.strftime('%Y-%m-%d %H:%M:%S'), timestamp]
+            row.extend([record.get(currency, '') for currency in currency_columns])
             
             writer.writerow(row)
+    except BaseException:
+        if csvfile is not None:
+            csvfile.close()
+            os.remove(tmp_path)
+        raise
+    
+    if csvfile is not None:
+        csvfile.close()
+        os.replace(tmp_path, csv_file_path)
+    
+    print(f"Filtered to {len(seen_dates)} daily records (12:00:00 only)")
+    
+    if not seen_dates:
+        print("No 12:00:00 price records found")
+        return
     
-    print(f"✅ Successfully converted {len(daily_prices)} daily records to CSV")
+    print(f"✅ Successfully converted {len(seen_dates)} daily records to CSV")
     print(f"📁 Output file: {csv_file_path}")
 
 def main():